@@ -1,5 +1,7 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from bitgrid import encode_grid
+from fingerprint import relabel_colors
+from plotting import pyplot, show
 
 def create_empty_grid(rows, cols):
     return np.full((rows, cols), 'E')
@@ -15,14 +17,16 @@ def place_shape(grid, row, col, shape, color):
 def is_shape_visible(grid, color):
     return color in grid
 
-def normalize_pattern(grid):
-    norm_grid = grid.copy()
-    norm_grid[norm_grid == "R"] = "X"
-    norm_grid[norm_grid == "G"] = "Y"
-    return ''.join(norm_grid.flatten())
+def normalize_pattern(grid, relabel=False):
+    # R->X / G->Y renaming was one-to-one and merged nothing; relabel=True
+    # keys by order of first colour appearance, merging colour swaps
+    if relabel:
+        return relabel_colors(encode_grid(grid)[None]).tobytes()
+    return ''.join(grid.ravel())
 
 def visualize_grid(grid, pattern_num):
     """Visualize the grid with red and green shapes"""
+    plt = pyplot()
     # Create RGB grid with proper color mapping
     rgb_grid = np.zeros((grid.shape[0], grid.shape[1], 3))
     for i in range(grid.shape[0]):
@@ -45,9 +49,9 @@ def visualize_grid(grid, pattern_num):
     ax.set_yticklabels([])
     ax.set_title(f"Pattern {pattern_num + 1}")
 
-    plt.show()
+    show()
 
-def generate_patterns(grid_size, shape1, shape2, shape2_is_rectangle):
+def generate_patterns(grid_size, shape1, shape2, shape2_is_rectangle, relabel=False):
     rows, cols = grid_size
     unique_patterns = {}
 
@@ -69,7 +73,7 @@ def generate_patterns(grid_size, shape1, shape2, shape2_is_rectangle):
                         if can_place(grid_shape1, r2, c2, orientation):
                             final_grid = place_shape(grid_shape1, r2, c2, orientation, 'G')
                             if is_shape_visible(final_grid, 'R'):
-                                norm_pattern = normalize_pattern(final_grid)
+                                norm_pattern = normalize_pattern(final_grid, relabel)
                                 unique_patterns[norm_pattern] = final_grid
 
     # Place shape2 first, then shape1
@@ -88,12 +92,12 @@ def generate_patterns(grid_size, shape1, shape2, shape2_is_rectangle):
                             final_grid = place_shape(grid_shape2, r1, c1, shape1, 'R')
 
                             if not is_shape_visible(final_grid, 'G'):
-                                norm_pattern = normalize_pattern(final_grid)
+                                norm_pattern = normalize_pattern(final_grid, relabel)
                                 if norm_pattern not in hidden_cases_seen:
                                     hidden_cases_seen.add(norm_pattern)
                                     unique_patterns[norm_pattern] = final_grid
                             else:
-                                norm_pattern = normalize_pattern(final_grid)
+                                norm_pattern = normalize_pattern(final_grid, relabel)
                                 unique_patterns[norm_pattern] = final_grid
 
     return list(unique_patterns.values())
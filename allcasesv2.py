@@ -1,6 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from itertools import permutations, product
+from bitgrid import encode_grid
+from fingerprint import relabel_colors
+from plotting import pyplot, show
 
 
 def create_empty_grid(rows, cols):
@@ -24,16 +26,16 @@ def is_shape_visible(grid, color):
     return color in grid
 
 
-def normalize_pattern(grid):
-    """Normalize the grid pattern to remove color differences."""
-    norm_grid = grid.copy()
-    norm_grid[norm_grid == "R"] = "X"
-    norm_grid[norm_grid == "G"] = "Y"
-    return ''.join(norm_grid.flatten())
+def normalize_pattern(grid, relabel=False):
+    """Dedupe key: the cells, or with relabel the colours renumbered by first appearance."""
+    if relabel:
+        return relabel_colors(encode_grid(grid)[None]).tobytes()
+    return ''.join(grid.ravel())
 
 
 def visualize_grid(grid, pattern_num):
     """Visualize the grid with red and green shapes"""
+    plt = pyplot()
     # Create RGB grid with proper color mapping
     rgb_grid = np.zeros((grid.shape[0], grid.shape[1], 3))
     
@@ -69,7 +71,7 @@ def visualize_grid(grid, pattern_num):
 
     ax.set_title(f"Pattern {pattern_num + 1}")
     plt.tight_layout()
-    plt.show()
+    show()
 
 
 def shape_orientations(shape):
@@ -79,7 +81,7 @@ def shape_orientations(shape):
     return [shape]  # Square has only one orientation
 
 
-def generate_patterns(grid_size, shape1, shape2):
+def generate_patterns(grid_size, shape1, shape2, relabel=False):
     rows, cols = grid_size
     unique_patterns = {}
 
@@ -102,7 +104,7 @@ def generate_patterns(grid_size, shape1, shape2):
             grids_to_process = new_grids
 
         for final_grid in grids_to_process:
-            norm = normalize_pattern(final_grid)
+            norm = normalize_pattern(final_grid, relabel)
             unique_patterns[norm] = final_grid
 
     return list(unique_patterns.values())
@@ -0,0 +1,78 @@
+import numpy as np
+from itertools import permutations
+from bitgrid import check_visible_colors, color_alphabet, create_empty_grid, decode_grid
+from placements import placement_table
+
+# ---------- placements -------------------------------------------------------
+def shape_placements(grid_size, shape):
+    """Every in-bounds placement of a shape and its cell masks.
+
+    Returns ``(placements, masks)``: ``placements`` is a list of
+    ``(oriented_shape, row, col)`` in the same (orientation, row, col) order the
+    nested-loop generators use, ``masks`` a read-only bool array of shape
+    ``(P, rows, cols)`` that is True where placement ``p`` covers the grid.
+    Both come from the cached placement table.
+    """
+    table = placement_table(grid_size, shape)
+    return list(table.placements), table.cell_masks
+
+# ---------- batched placement ------------------------------------------------
+def place_batch(stack, masks, code):
+    """Place one shape into every partial layout of a stack at once.
+
+    ``stack`` is an ``(N, rows, cols)`` uint8 code stack and ``masks`` the
+    ``(P, rows, cols)`` placement masks of the shape.  The result is the
+    ``(N * P, rows, cols)`` stack where row ``n * P + p`` is layout ``n`` with
+    placement ``p`` painted in ``code``.
+    """
+    n, rows, cols = stack.shape
+    out = np.where(masks[None, :, :, :], np.uint8(code), stack[:, None, :, :])
+    return out.reshape(n * masks.shape[0], rows, cols)
+
+def visible_rows(stack, code):
+    """Boolean index of the layouts in which ``code`` is still visible."""
+    return (stack == code).any(axis=(1, 2))
+
+def enumerate_order(grid_size, shapes, order, colors=None, require_visible=False):
+    """All layouts for one stacking order as a single uint8 code stack."""
+    if require_visible:
+        check_visible_colors(shapes)
+    if colors is None:
+        colors = color_alphabet(shapes)
+    stack = create_empty_grid(*grid_size)[None]
+    placed = []
+    for idx in order:
+        shape, color = shapes[idx]
+        code = colors.index(color)
+        _, masks = shape_placements(grid_size, shape)
+        stack = place_batch(stack, masks, code)
+        if require_visible:
+            # drop layouts in which an earlier shape has just been buried
+            for earlier in placed:
+                stack = stack[visible_rows(stack, earlier)]
+        placed.append(code)
+    return stack
+
+def generate_patterns(grid_size, shapes, require_visible=False):
+    """Stack of every layout over all stacking orders (duplicates included)."""
+    colors = color_alphabet(shapes)
+    stacks = [enumerate_order(grid_size, shapes, order, colors, require_visible)
+              for order in permutations(range(len(shapes)))]
+    return np.concatenate(stacks), colors
+
+# ---------- driver -----------------------------------------------------------
+def main():
+    grid_size = (3, 9)
+    shapes = [((3, 3), 'R'),   # red square
+              ((2, 5), 'G'),   # green rectangle
+              ((1, 9), 'B')]   # blue rectangle
+
+    stack, colors = generate_patterns(grid_size, shapes)
+    unique = np.unique(stack.reshape(len(stack), -1), axis=0)
+
+    print(f"Total patterns generated: {len(stack)}")
+    print(f"Total unique patterns : {len(unique)}")
+    print(f"\nPattern 1:\n{decode_grid(stack[0], colors)}")
+
+if __name__ == "__main__":
+    main()
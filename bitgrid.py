@@ -0,0 +1,186 @@
+import numpy as np
+
+# ---------- compact grids ----------------------------------------------------
+# Code 0 is always the empty cell; every other code indexes a colour in the
+# alphabet.  The same alphabet is used for the uint8 code arrays and for the
+# bit-plane boards below, so the two forms convert into each other losslessly.
+DEFAULT_COLORS = ('E', 'R', 'G', 'B')
+EMPTY = 0
+
+
+def color_alphabet(shapes, empty='E'):
+    """Alphabet for a list of (shape, color) pairs, empty colour first."""
+    colors = [empty]
+    for _, color in shapes:
+        if color not in colors:
+            colors.append(color)
+    return tuple(colors)
+
+
+def check_visible_colors(shapes):
+    """Reject shapes that share a colour when every shape must stay visible.
+
+    Visibility is tracked per colour (bit-plane or code), which cannot tell
+    two shapes of the same colour apart.
+    """
+    colors = [color for _, color in shapes]
+    if len(set(colors)) != len(colors):
+        raise ValueError(f"require_visible needs one distinct color per shape, got {colors}.")
+
+
+def create_empty_grid(rows, cols):
+    """uint8 code grid with every cell empty."""
+    return np.zeros((rows, cols), dtype=np.uint8)
+
+
+def encode_grid(grid, colors=DEFAULT_COLORS):
+    """Convert a string grid ('E', 'R', ...) to a uint8 code grid."""
+    grid = np.asarray(grid)
+    codes = np.zeros(grid.shape, dtype=np.uint8)
+    known = np.zeros(grid.shape, dtype=bool)
+    for code, color in enumerate(colors):
+        hit = grid == color
+        codes[hit] = code
+        known |= hit
+    if not known.all():
+        unknown = sorted(set(grid[~known].tolist()))
+        raise ValueError(f"Colors {unknown} are not in the alphabet {colors}.")
+    return codes
+
+
+def decode_grid(codes, colors=DEFAULT_COLORS):
+    """Convert a uint8 code grid (or stack of grids) back to strings."""
+    return np.asarray(colors)[codes]
+
+
+def bits_per_cell(n_colors):
+    """Smallest of 1, 2, 4, 8 bits that holds every colour code."""
+    bits = max(1, (n_colors - 1).bit_length())
+    for width in (1, 2, 4, 8):
+        if bits <= width:
+            return width
+    raise ValueError(f"{n_colors} colors do not fit in one byte per cell.")
+
+
+def pack_codes(stack, bits):
+    """Bit-pack an (N, rows, cols) code stack into (N, nbytes) uint8 rows.
+
+    Cells are stored ``bits`` bits each, little-endian within every byte, and
+    each grid is padded to a whole number of bytes.
+    """
+    stack = np.asarray(stack, dtype=np.uint8)
+    flat = stack.reshape(len(stack), -1)
+    if bits == 8:
+        return np.ascontiguousarray(flat)
+    per_byte = 8 // bits
+    pad = (-flat.shape[1]) % per_byte
+    if pad:
+        flat = np.concatenate([flat, np.zeros((len(flat), pad), dtype=np.uint8)], axis=1)
+    cells = flat.reshape(len(flat), -1, per_byte).astype(np.uint16)
+    shifts = np.arange(per_byte, dtype=np.uint16) * bits
+    return (cells << shifts).sum(axis=2).astype(np.uint8)
+
+
+def unpack_codes(packed, grid_size, bits):
+    """Inverse of ``pack_codes``: (N, nbytes) uint8 rows -> (N, rows, cols)."""
+    packed = np.asarray(packed, dtype=np.uint8)
+    rows, cols = grid_size
+    if bits == 8:
+        return packed.reshape(len(packed), rows, cols)
+    per_byte = 8 // bits
+    shifts = np.arange(per_byte, dtype=np.uint8) * bits
+    cells = (packed[:, :, None] >> shifts) & np.uint8((1 << bits) - 1)
+    return cells.reshape(len(packed), -1)[:, :rows * cols].reshape(len(packed), rows, cols)
+
+
+def place_shape(grid, row, col, shape, code):
+    """Return a new code grid with the shape placed at (row, col)."""
+    g = grid.copy()
+    g[row:row + shape[0], col:col + shape[1]] = code
+    return g
+
+
+# ---------- bitboards --------------------------------------------------------
+# A board is a tuple of Python ints, one bit-plane per non-empty colour code
+# (plane i holds code i + 1).  Bit r * cols + c is cell (r, c).  Boards are
+# plain tuples, so ``==`` compares layouts and ``hash()`` / set membership
+# work directly without any conversion.
+
+def fits(grid_size, row, col, shape):
+    """Check if a shape fits within the grid boundaries."""
+    return row + shape[0] <= grid_size[0] and col + shape[1] <= grid_size[1]
+
+
+def rect_mask(grid_size, row, col, shape):
+    """Bitmask of the cells covered by a shape placed at (row, col)."""
+    cols = grid_size[1]
+    row_bits = ((1 << shape[1]) - 1) << col
+    mask = 0
+    for i in range(shape[0]):
+        mask |= row_bits << ((row + i) * cols)
+    return mask
+
+
+def empty_board(n_colors):
+    """Board with every cell empty for an alphabet of ``n_colors`` colours."""
+    return (0,) * (n_colors - 1)
+
+
+def place_mask(board, mask, code):
+    """Return a new board with ``mask`` painted in colour ``code``.
+
+    Cells already showing ``code`` (another shape of the same colour) stay.
+    """
+    keep = ~mask
+    return tuple(plane | mask if i == code - 1 else plane & keep
+                 for i, plane in enumerate(board))
+
+
+def overlay(lower, upper):
+    """Stack ``upper`` on top of ``lower``; upper's non-empty cells win."""
+    covered = 0
+    for plane in upper:
+        covered |= plane
+    keep = ~covered
+    return tuple((lo & keep) | up for lo, up in zip(lower, upper))
+
+
+def occupied(board):
+    """Bitmask of every non-empty cell."""
+    mask = 0
+    for plane in board:
+        mask |= plane
+    return mask
+
+
+def visible_cells(board, code):
+    """Number of cells currently showing colour ``code``."""
+    return board[code - 1].bit_count()
+
+
+def board_to_codes(board, grid_size):
+    """Expand a board into a uint8 code grid."""
+    rows, cols = grid_size
+    n = rows * cols
+    codes = np.zeros(n, dtype=np.uint8)
+    nbytes = (n + 7) // 8
+    for i, plane in enumerate(board):
+        if plane:
+            bits = np.unpackbits(
+                np.frombuffer(plane.to_bytes(nbytes, 'little'), dtype=np.uint8),
+                bitorder='little')[:n]
+            codes[bits.astype(bool)] = i + 1
+    return codes.reshape(rows, cols)
+
+
+def codes_to_board(codes, n_colors):
+    """Pack a uint8 code grid into a board."""
+    flat = np.asarray(codes).ravel()
+    return tuple(int.from_bytes(np.packbits(flat == code, bitorder='little').tobytes(),
+                                'little')
+                 for code in range(1, n_colors))
+
+
+def decode_board(board, grid_size, colors=DEFAULT_COLORS):
+    """Expand a board straight into a string grid."""
+    return decode_grid(board_to_codes(board, grid_size), colors)
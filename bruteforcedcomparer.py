@@ -1,7578 +1,64 @@
+import os
+import sys
 import numpy as np
-
-
-def normalize_with_exact_colors(grid):
-    return ''.join(grid.flatten())
-
-def test_duplicate_removal():
-    grid1 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid2 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid3 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid4 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid5 = np.array([
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid6 = np.array([
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid7 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid8 = np.array([
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid9 = np.array([
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid10 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid11 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid12 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid13 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid14 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid15 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid16 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid17 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid18 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid19 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid20 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid21 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid22 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid23 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid24 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid25 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid26 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid27 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid28 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid29 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid30 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid31 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid32 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid33 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid34 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid35 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid36 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid37 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid38 = np.array([
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid39 = np.array([
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid40 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid41 = np.array([
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid42 = np.array([
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid43 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid44 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid45 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid46 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid47 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid48 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid49 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid50 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid51 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid52 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid53 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid54 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid55 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid56 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid57 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid58 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid59 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid60 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid61 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid62 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid63 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid64 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid65 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid66 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid67 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid68 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid69 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid70 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid71 = np.array([
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid72 = np.array([
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid73 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid74 = np.array([
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid75 = np.array([
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid76 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid77 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid78 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid79 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid80 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid81 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid82 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid83 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid84 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid85 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid86 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid87 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid88 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid89 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid90 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid91 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid92 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid93 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid94 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid95 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid96 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid97 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid98 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid99 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid100 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid101 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid102 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid103 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid104 = np.array([
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid105 = np.array([
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid106 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid107 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid108 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid109 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid110 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid111 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid112 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid113 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid114 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid115 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid116 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid117 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid118 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid119 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid120 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid121 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid122 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid123 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid124 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid125 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid126 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid127 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid128 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid129 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid130 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid131 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid132 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid133 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid134 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid135 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid136 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid137 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid138 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid139 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-    ])
-
-    grid140 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-    ])
-
-    grid141 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid142 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid143 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid144 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid145 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid146 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid147 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid148 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid149 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid150 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid151 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid152 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid153 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid154 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid155 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid156 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid157 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid158 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid159 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid160 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid161 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid162 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid163 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid164 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid165 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid166 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid167 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid168 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid169 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-    ])
-
-    grid170 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-    ])
-
-    grid171 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid172 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-    ])
-
-    grid173 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-    ])
-
-    grid174 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid175 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid176 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid177 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid178 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid179 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid180 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid181 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid182 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid183 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid184 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid185 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid186 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid187 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid188 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid189 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid190 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid191 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid192 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid193 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid194 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid195 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid196 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid197 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid198 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid199 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid200 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid201 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid202 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-    ])
-
-    grid203 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-    ])
-
-    grid204 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid205 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-    ])
-
-    grid206 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-    ])
-
-    grid207 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid208 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid209 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid210 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid211 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid212 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid213 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid214 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid215 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid216 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid217 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid218 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid219 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid220 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid221 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid222 = np.array([
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid223 = np.array([
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid224 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid225 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid226 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid227 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid228 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid229 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid230 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid231 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid232 = np.array([
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid233 = np.array([
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid234 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid235 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid236 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid237 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid238 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid239 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid240 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid241 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid242 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid243 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid244 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid245 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid246 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid247 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid248 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid249 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid250 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid251 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid252 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid253 = np.array([
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid254 = np.array([
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid255 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid256 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid257 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid258 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid259 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid260 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid261 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid262 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid263 = np.array([
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid264 = np.array([
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid265 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid266 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid267 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid268 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid269 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid270 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid271 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid272 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid273 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid274 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid275 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid276 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid277 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid278 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid279 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid280 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid281 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid282 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid283 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid284 = np.array([
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid285 = np.array([
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid286 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid287 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid288 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid289 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid290 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid291 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid292 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid293 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid294 = np.array([
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid295 = np.array([
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid296 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid297 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid298 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid299 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid300 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid301 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid302 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid303 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid304 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid305 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid306 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid307 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid308 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid309 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid310 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid311 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid312 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid313 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid314 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid315 = np.array([
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid316 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid317 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid318 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid319 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid320 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid321 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid322 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid323 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid324 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid325 = np.array([
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid326 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid327 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid328 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid329 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid330 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid331 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid332 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid333 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid334 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid335 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid336 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid337 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-    ])
-
-    grid338 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid339 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid340 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid341 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid342 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid343 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid344 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid345 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid346 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid347 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-    ])
-
-    grid348 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid349 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid350 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid351 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid352 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid353 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid354 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid355 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid356 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid357 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid358 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid359 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid360 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid361 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid362 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid363 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid364 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid365 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid366 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid367 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-    ])
-
-    grid368 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-    ])
-
-    grid369 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid370 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid371 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid372 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid373 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid374 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid375 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid376 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid377 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-    ])
-
-    grid378 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-    ])
-
-    grid379 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid380 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid381 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid382 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid383 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid384 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid385 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid386 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid387 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid388 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid389 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid390 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid391 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid392 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid393 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid394 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid395 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid396 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid397 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid398 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-    ])
-
-    grid399 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-    ])
-
-    grid400 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid401 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid402 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid403 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid404 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid405 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid406 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid407 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid408 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-    ])
-
-    grid409 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-    ])
-
-    grid410 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid411 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid412 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid413 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid414 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid415 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid416 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid417 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid418 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid419 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid420 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid421 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid422 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid423 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid424 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid425 = np.array([
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid426 = np.array([
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid427 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid428 = np.array([
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid429 = np.array([
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid430 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid431 = np.array([
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid432 = np.array([
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid433 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid434 = np.array([
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid435 = np.array([
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid436 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid437 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid438 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid439 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid440 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid441 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid442 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid443 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid444 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid445 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid446 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid447 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid448 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid449 = np.array([
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid450 = np.array([
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid451 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid452 = np.array([
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid453 = np.array([
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid454 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid455 = np.array([
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid456 = np.array([
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid457 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid458 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid459 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid460 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid461 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid462 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid463 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid464 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid465 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid466 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid467 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid468 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid469 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid470 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid471 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid472 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid473 = np.array([
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid474 = np.array([
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid475 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid476 = np.array([
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid477 = np.array([
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid478 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid479 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid480 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid481 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid482 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid483 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid484 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid485 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid486 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid487 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid488 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid489 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid490 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid491 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid492 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid493 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid494 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid495 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid496 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid497 = np.array([
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid498 = np.array([
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid499 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid500 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid501 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid502 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid503 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid504 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid505 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid506 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid507 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid508 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid509 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid510 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid511 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid512 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid513 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid514 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid515 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid516 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid517 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid518 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid519 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid520 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid521 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid522 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid523 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid524 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid525 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid526 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid527 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid528 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid529 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid530 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid531 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid532 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid533 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid534 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid535 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid536 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid537 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid538 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid539 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid540 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid541 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid542 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid543 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid544 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid545 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid546 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid547 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid548 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid549 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid550 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid551 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid552 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid553 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid554 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid555 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid556 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid557 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid558 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid559 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid560 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid561 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid562 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid563 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid564 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid565 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid566 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid567 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid568 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid569 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid570 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid571 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid572 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid573 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid574 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid575 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid576 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid577 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-    ])
-
-    grid578 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-    ])
-
-    grid579 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid580 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid581 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid582 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid583 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid584 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid585 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid586 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid587 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid588 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid589 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid590 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid591 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid592 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid593 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid594 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid595 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid596 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid597 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid598 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-    ])
-
-    grid599 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-    ])
-
-    grid600 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid601 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-    ])
-
-    grid602 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-    ])
-
-    grid603 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid604 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid605 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid606 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid607 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid608 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid609 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid610 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid611 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid612 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid613 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid614 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid615 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid616 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid617 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid618 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid619 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-    ])
-
-    grid620 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-    ])
-
-    grid621 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid622 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-    ])
-
-    grid623 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-    ])
-
-    grid624 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid625 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-    ])
-
-    grid626 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-    ])
-
-    grid627 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid628 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid629 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid630 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid631 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid632 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid633 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid634 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid635 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid636 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid637 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid638 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid639 = np.array([
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid640 = np.array([
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid641 = np.array([
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid642 = np.array([
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid643 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid644 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid645 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid646 = np.array([
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid647 = np.array([
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid648 = np.array([
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid649 = np.array([
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid650 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid651 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid652 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid653 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid654 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid655 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid656 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid657 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid658 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid659 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid660 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid661 = np.array([
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid662 = np.array([
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid663 = np.array([
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid664 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid665 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid666 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid667 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid668 = np.array([
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid669 = np.array([
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid670 = np.array([
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid671 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid672 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid673 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid674 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid675 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid676 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid677 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid678 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid679 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid680 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid681 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid682 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid683 = np.array([
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid684 = np.array([
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid685 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid686 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid687 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid688 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid689 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid690 = np.array([
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid691 = np.array([
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid692 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid693 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid694 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid695 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid696 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid697 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid698 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid699 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid700 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid701 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid702 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid703 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid704 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid705 = np.array([
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid706 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid707 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid708 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid709 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid710 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid711 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid712 = np.array([
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid713 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid714 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid715 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid716 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid717 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid718 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid719 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid720 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid721 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid722 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid723 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid724 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid725 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid726 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid727 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid728 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid729 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid730 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid731 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid732 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid733 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid734 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid735 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid736 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid737 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid738 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid739 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid740 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid741 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid742 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid743 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid744 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid745 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid746 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid747 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid748 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid749 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid750 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid751 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid752 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid753 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid754 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid755 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid756 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid757 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid758 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid759 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid760 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid761 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid762 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid763 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid764 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid765 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid766 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid767 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid768 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid769 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid770 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid771 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid772 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid773 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid774 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid775 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid776 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid777 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid778 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid779 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid780 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid781 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-    ])
-
-    grid782 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid783 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid784 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid785 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid786 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid787 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid788 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-    ])
-
-    grid789 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid790 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid791 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid792 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid793 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid794 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid795 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid796 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid797 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid798 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid799 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid800 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid801 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid802 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-    ])
-
-    grid803 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-    ])
-
-    grid804 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid805 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid806 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid807 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid808 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid809 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-    ])
-
-    grid810 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-    ])
-
-    grid811 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid812 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid813 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid814 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid815 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid816 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid817 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid818 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid819 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid820 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid821 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid822 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid823 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-    ])
-
-    grid824 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-    ])
-
-    grid825 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-    ])
-
-    grid826 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid827 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid828 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid829 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid830 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-    ])
-
-    grid831 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-    ])
-
-    grid832 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-    ])
-
-    grid833 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid834 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid835 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid836 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid837 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid838 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid839 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid840 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid841 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid842 = np.array([
-        ['R', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid843 = np.array([
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid844 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid845 = np.array([
-        ['R', 'R', 'R', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid846 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid847 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid848 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid849 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid850 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid851 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid852 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid853 = np.array([
-        ['B', 'R', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid854 = np.array([
-        ['B', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid855 = np.array([
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid856 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid857 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid858 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid859 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid860 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid861 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid862 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid863 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid864 = np.array([
-        ['B', 'B', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid865 = np.array([
-        ['B', 'B', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid866 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid867 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid868 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid869 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid870 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid871 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid872 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid873 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid874 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid875 = np.array([
-        ['B', 'B', 'B', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid876 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid877 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid878 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid879 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid880 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid881 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid882 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid883 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid884 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid885 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid886 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid887 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-    ])
-
-    grid888 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid889 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid890 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid891 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid892 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid893 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid894 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid895 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid896 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid897 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-    ])
-
-    grid898 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-    ])
-
-    grid899 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid900 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid901 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid902 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid903 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid904 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid905 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid906 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid907 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid908 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-    ])
-
-    grid909 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-    ])
-
-    grid910 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid911 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid912 = np.array([
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid913 = np.array([
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid914 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid915 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid916 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid917 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid918 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid919 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid920 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid921 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid922 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid923 = np.array([
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid924 = np.array([
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid925 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid926 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid927 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid928 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid929 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid930 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid931 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid932 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid933 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid934 = np.array([
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid935 = np.array([
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid936 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid937 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid938 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid939 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid940 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid941 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid942 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid943 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid944 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid945 = np.array([
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid946 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid947 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid948 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid949 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid950 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid951 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid952 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid953 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid954 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid955 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid956 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid957 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-    ])
-
-    grid958 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid959 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid960 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid961 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid962 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid963 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid964 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid965 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid966 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid967 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-    ])
-
-    grid968 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-    ])
-
-    grid969 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid970 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid971 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid972 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid973 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid974 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid975 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid976 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid977 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid978 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-    ])
-
-    grid979 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-    ])
-
-    grid980 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid981 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid982 = np.array([
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid983 = np.array([
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid984 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid985 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid986 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid987 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid988 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid989 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid990 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid991 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid992 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid993 = np.array([
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid994 = np.array([
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid995 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid996 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid997 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid998 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid999 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid1000 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1001 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1002 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1003 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1004 = np.array([
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1005 = np.array([
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1006 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1007 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid1008 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid1009 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid1010 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1011 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1012 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1013 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1014 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1015 = np.array([
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1016 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1017 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid1018 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid1019 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid1020 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1021 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1022 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1023 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1024 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1025 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1026 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1027 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'B', 'B'],
-    ])
-
-    grid1028 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid1029 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid1030 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1031 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1032 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1033 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1034 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1035 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1036 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1037 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'B'],
-    ])
-
-    grid1038 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'R', 'B'],
-    ])
-
-    grid1039 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid1040 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1041 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1042 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1043 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1044 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1045 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1046 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1047 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1048 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'G', 'R', 'R'],
-    ])
-
-    grid1049 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'G', 'G', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'G', 'G', 'R'],
-    ])
-
-    grid1050 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1051 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1052 = np.array([
-        ['G', 'R', 'R', 'R', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1053 = np.array([
-        ['G', 'G', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1054 = np.array([
-        ['G', 'G', 'G', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1055 = np.array([
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1056 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1057 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1058 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1059 = np.array([
-        ['B', 'R', 'R', 'R', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1060 = np.array([
-        ['B', 'G', 'R', 'R', 'R', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1061 = np.array([
-        ['B', 'G', 'G', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1062 = np.array([
-        ['B', 'G', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1063 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1064 = np.array([
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1065 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1066 = np.array([
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1067 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1068 = np.array([
-        ['B', 'B', 'G', 'R', 'R', 'R', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1069 = np.array([
-        ['B', 'B', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1070 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1071 = np.array([
-        ['B', 'B', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1072 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1073 = np.array([
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1074 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1075 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1076 = np.array([
-        ['B', 'B', 'B', 'G', 'R', 'R', 'R', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1077 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1078 = np.array([
-        ['B', 'B', 'B', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1079 = np.array([
-        ['R', 'R', 'R', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1080 = np.array([
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1081 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1082 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1083 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1084 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1085 = np.array([
-        ['B', 'B', 'B', 'B', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1086 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1087 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1088 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1089 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1090 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1091 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1092 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1093 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid1094 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid1095 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid1096 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1097 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1098 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1099 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1100 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid1101 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid1102 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid1103 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-    ])
-
-    grid1104 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1105 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1106 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1107 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid1108 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid1109 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid1110 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-    ])
-
-    grid1111 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-    ])
-
-    grid1112 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1113 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1114 = np.array([
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1115 = np.array([
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1116 = np.array([
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1117 = np.array([
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-    ])
-
-    grid1118 = np.array([
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-    ])
-
-    grid1119 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-    ])
-
-    grid1120 = np.array([
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1121 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1122 = np.array([
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'B', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1123 = np.array([
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1124 = np.array([
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1125 = np.array([
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1126 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1127 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1128 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1129 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1130 = np.array([
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'R', 'R', 'R', 'G', 'B', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1131 = np.array([
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1132 = np.array([
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1133 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1134 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1135 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1136 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1137 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1138 = np.array([
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'R', 'R', 'R', 'G', 'B', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1139 = np.array([
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1140 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1141 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1142 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1143 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1144 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1145 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1146 = np.array([
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'R', 'R', 'R', 'G', 'B'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1147 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1148 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1149 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1150 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1151 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1152 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1153 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1154 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1155 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1156 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'B', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1157 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'B', 'B', 'B', 'B'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1158 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-    ])
-
-    grid1159 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1160 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1161 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1162 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-    ])
-
-    grid1163 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'B', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid1164 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'B', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid1165 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'G', 'R', 'R', 'R', 'G', 'B', 'B', 'B'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-    ])
-
-    grid1166 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'R', 'R', 'R', 'B', 'B', 'B'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-    ])
-
-    grid1167 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1168 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1169 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1170 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'B', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid1171 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'B', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid1172 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'B', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-    ])
-
-    grid1173 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'G', 'R', 'R', 'R', 'G', 'B', 'B'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-    ])
-
-    grid1174 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-    ])
-
-    grid1175 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1176 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1177 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid1178 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'B'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid1179 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'G', 'B'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-    ])
-
-    grid1180 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'G', 'G', 'B'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-    ])
-
-    grid1181 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'G', 'R', 'R', 'R', 'G', 'B'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-    ])
-
-    grid1182 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'R', 'R', 'R', 'B'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-    ])
-
-    grid1183 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1184 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1185 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1186 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1187 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-    ])
-
-    grid1188 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-    ])
-
-    grid1189 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-    ])
-
-    grid1190 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1191 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1192 = np.array([
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1193 = np.array([
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1194 = np.array([
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1195 = np.array([
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1196 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1197 = np.array([
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1198 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1199 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1200 = np.array([
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1201 = np.array([
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1202 = np.array([
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1203 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1204 = np.array([
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1205 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1206 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1207 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1208 = np.array([
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1209 = np.array([
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1210 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1211 = np.array([
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1212 = np.array([
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1213 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1214 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1215 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1216 = np.array([
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1217 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1218 = np.array([
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1219 = np.array([
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1220 = np.array([
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'B', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1221 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1222 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1223 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1224 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'B', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1225 = np.array([
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'B', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1226 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1227 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'E', 'E', 'E', 'E'],
-        ['G', 'R', 'R', 'R', 'G', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1228 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['G', 'G', 'R', 'R', 'R', 'B', 'B', 'B', 'B'],
-    ])
-
-    grid1229 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['G', 'G', 'G', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1230 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['G', 'G', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1231 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['G', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1232 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'E', 'R', 'R', 'R'],
-        ['G', 'G', 'G', 'G', 'G', 'B', 'R', 'R', 'R'],
-    ])
-
-    grid1233 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid1234 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'E', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid1235 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'G', 'R', 'R', 'R', 'G', 'E', 'E', 'E'],
-        ['B', 'G', 'R', 'R', 'R', 'G', 'B', 'B', 'B'],
-    ])
-
-    grid1236 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'G', 'G', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['B', 'G', 'G', 'R', 'R', 'R', 'B', 'B', 'B'],
-    ])
-
-    grid1237 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'G', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'G', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1238 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'G', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1239 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'G', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1240 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid1241 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'E', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid1242 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'E', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'B', 'B'],
-    ])
-
-    grid1243 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'G', 'R', 'R', 'R', 'G', 'E', 'E'],
-        ['B', 'B', 'G', 'R', 'R', 'R', 'G', 'B', 'B'],
-    ])
-
-    grid1244 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'G', 'G', 'R', 'R', 'R', 'E', 'E'],
-        ['B', 'B', 'G', 'G', 'R', 'R', 'R', 'B', 'B'],
-    ])
-
-    grid1245 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'G', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'G', 'G', 'G', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1246 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'G', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1247 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'E'],
-        ['R', 'R', 'R', 'G', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid1248 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'E'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid1249 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'E'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'G', 'B'],
-    ])
-
-    grid1250 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'E'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'G', 'G', 'B'],
-    ])
-
-    grid1251 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'G', 'R', 'R', 'R', 'G', 'E'],
-        ['B', 'B', 'B', 'G', 'R', 'R', 'R', 'G', 'B'],
-    ])
-
-    grid1252 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'G', 'G', 'R', 'R', 'R', 'E'],
-        ['B', 'B', 'B', 'G', 'G', 'R', 'R', 'R', 'B'],
-    ])
-
-    grid1253 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'G', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'G', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    grid1254 = np.array([
-        ['R', 'R', 'R', 'E', 'E', 'E', 'E', 'E', 'E'],
-        ['R', 'R', 'R', 'E', 'G', 'G', 'G', 'G', 'G'],
-        ['R', 'R', 'R', 'B', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1255 = np.array([
-        ['E', 'R', 'R', 'R', 'E', 'E', 'E', 'E', 'E'],
-        ['E', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-        ['B', 'R', 'R', 'R', 'G', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1256 = np.array([
-        ['E', 'E', 'R', 'R', 'R', 'E', 'E', 'E', 'E'],
-        ['E', 'E', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-        ['B', 'B', 'R', 'R', 'R', 'G', 'G', 'G', 'G'],
-    ])
-
-    grid1257 = np.array([
-        ['E', 'E', 'E', 'R', 'R', 'R', 'E', 'E', 'E'],
-        ['E', 'E', 'E', 'R', 'R', 'R', 'G', 'G', 'G'],
-        ['B', 'B', 'B', 'R', 'R', 'R', 'G', 'G', 'G'],
-    ])
-
-    grid1258 = np.array([
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'E', 'E'],
-        ['E', 'E', 'E', 'E', 'R', 'R', 'R', 'G', 'G'],
-        ['B', 'B', 'B', 'B', 'R', 'R', 'R', 'G', 'G'],
-    ])
-
-    grid1259 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'R', 'R', 'R', 'E'],
-        ['E', 'E', 'E', 'E', 'G', 'R', 'R', 'R', 'G'],
-        ['B', 'B', 'B', 'B', 'G', 'R', 'R', 'R', 'G'],
-    ])
-
-    grid1260 = np.array([
-        ['E', 'E', 'E', 'E', 'E', 'E', 'R', 'R', 'R'],
-        ['E', 'E', 'E', 'E', 'G', 'G', 'R', 'R', 'R'],
-        ['B', 'B', 'B', 'B', 'G', 'G', 'R', 'R', 'R'],
-    ])
-
-    patterns = {}
-    for idx, grid in enumerate([grid1, grid2, grid3, grid4, grid5, grid6, grid7, grid8, grid9, grid10, grid11, grid12, grid13, grid14, grid15, grid16, grid17, grid18, grid19, grid20, grid21, grid22, grid23, grid24, grid25, grid26, grid27, grid28, grid29, grid30, grid31, grid32, grid33, grid34, grid35, grid36, grid37, grid38, grid39, grid40, grid41, grid42, grid43, grid44, grid45, grid46, grid47, grid48, grid49, grid50, grid51, grid52, grid53, grid54, grid55, grid56, grid57, grid58, grid59, grid60, grid61, grid62, grid63, grid64, grid65, grid66, grid67, grid68, grid69, grid70, grid71, grid72, grid73, grid74, grid75, grid76, grid77, grid78, grid79, grid80, grid81, grid82, grid83, grid84, grid85, grid86, grid87, grid88, grid89, grid90, grid91, grid92, grid93, grid94, grid95, grid96, grid97, grid98, grid99, grid100, grid101, grid102, grid103, grid104, grid105, grid106, grid107, grid108, grid109, grid110, grid111, grid112, grid113, grid114, grid115, grid116, grid117, grid118, grid119, grid120, grid121, grid122, grid123, grid124, grid125, grid126, grid127, grid128, grid129, grid130, grid131, grid132, grid133, grid134, grid135, grid136, grid137, grid138, grid139, grid140, grid141, grid142, grid143, grid144, grid145, grid146, grid147, grid148, grid149, grid150, grid151, grid152, grid153, grid154, grid155, grid156, grid157, grid158, grid159, grid160, grid161, grid162, grid163, grid164, grid165, grid166, grid167, grid168, grid169, grid170, grid171, grid172, grid173, grid174, grid175, grid176, grid177, grid178, grid179, grid180, grid181, grid182, grid183, grid184, grid185, grid186, grid187, grid188, grid189, grid190, grid191, grid192, grid193, grid194, grid195, grid196, grid197, grid198, grid199, grid200, grid201, grid202, grid203, grid204, grid205, grid206, grid207, grid208, grid209, grid210, grid211, grid212, grid213, grid214, grid215, grid216, grid217, grid218, grid219, grid220, grid221, grid222, grid223, grid224, grid225, grid226, grid227, grid228, grid229, grid230, grid231, grid232, grid233, grid234, grid235, grid236, grid237, grid238, grid239, grid240, grid241, grid242, grid243, grid244, grid245, grid246, grid247, grid248, grid249, grid250, grid251, grid252, grid253, grid254, grid255, grid256, grid257, grid258, grid259, grid260, grid261, grid262, grid263, grid264, grid265, grid266, grid267, grid268, grid269, grid270, grid271, grid272, grid273, grid274, grid275, grid276, grid277, grid278, grid279, grid280, grid281, grid282, grid283, grid284, grid285, grid286, grid287, grid288, grid289, grid290, grid291, grid292, grid293, grid294, grid295, grid296, grid297, grid298, grid299, grid300, grid301, grid302, grid303, grid304, grid305, grid306, grid307, grid308, grid309, grid310, grid311, grid312, grid313, grid314, grid315, grid316, grid317, grid318, grid319, grid320, grid321, grid322, grid323, grid324, grid325, grid326, grid327, grid328, grid329, grid330, grid331, grid332, grid333, grid334, grid335, grid336, grid337, grid338, grid339, grid340, grid341, grid342, grid343, grid344, grid345, grid346, grid347, grid348, grid349, grid350, grid351, grid352, grid353, grid354, grid355, grid356, grid357, grid358, grid359, grid360, grid361, grid362, grid363, grid364, grid365, grid366, grid367, grid368, grid369, grid370, grid371, grid372, grid373, grid374, grid375, grid376, grid377, grid378, grid379, grid380, grid381, grid382, grid383, grid384, grid385, grid386, grid387, grid388, grid389, grid390, grid391, grid392, grid393, grid394, grid395, grid396, grid397, grid398, grid399, grid400, grid401, grid402, grid403, grid404, grid405, grid406, grid407, grid408, grid409, grid410, grid411, grid412, grid413, grid414, grid415, grid416, grid417, grid418, grid419, grid420, grid421, grid422, grid423, grid424, grid425, grid426, grid427, grid428, grid429, grid430, grid431, grid432, grid433, grid434, grid435, grid436, grid437, grid438, grid439, grid440, grid441, grid442, grid443, grid444, grid445, grid446, grid447, grid448, grid449, grid450, grid451, grid452, grid453, grid454, grid455, grid456, grid457, grid458, grid459, grid460, grid461, grid462, grid463, grid464, grid465, grid466, grid467, grid468, grid469, grid470, grid471, grid472, grid473, grid474, grid475, grid476, grid477, grid478, grid479, grid480, grid481, grid482, grid483, grid484, grid485, grid486, grid487, grid488, grid489, grid490, grid491, grid492, grid493, grid494, grid495, grid496, grid497, grid498, grid499, grid500, grid501, grid502, grid503, grid504, grid505, grid506, grid507, grid508, grid509, grid510, grid511, grid512, grid513, grid514, grid515, grid516, grid517, grid518, grid519, grid520, grid521, grid522, grid523, grid524, grid525, grid526, grid527, grid528, grid529, grid530, grid531, grid532, grid533, grid534, grid535, grid536, grid537, grid538, grid539, grid540, grid541, grid542, grid543, grid544, grid545, grid546, grid547, grid548, grid549, grid550, grid551, grid552, grid553, grid554, grid555, grid556, grid557, grid558, grid559, grid560, grid561, grid562, grid563, grid564, grid565, grid566, grid567, grid568, grid569, grid570, grid571, grid572, grid573, grid574, grid575, grid576, grid577, grid578, grid579, grid580, grid581, grid582, grid583, grid584, grid585, grid586, grid587, grid588, grid589, grid590, grid591, grid592, grid593, grid594, grid595, grid596, grid597, grid598, grid599, grid600, grid601, grid602, grid603, grid604, grid605, grid606, grid607, grid608, grid609, grid610, grid611, grid612, grid613, grid614, grid615, grid616, grid617, grid618, grid619, grid620, grid621, grid622, grid623, grid624, grid625, grid626, grid627, grid628, grid629, grid630, grid631, grid632, grid633, grid634, grid635, grid636, grid637, grid638, grid639, grid640, grid641, grid642, grid643, grid644, grid645, grid646, grid647, grid648, grid649, grid650, grid651, grid652, grid653, grid654, grid655, grid656, grid657, grid658, grid659, grid660, grid661, grid662, grid663, grid664, grid665, grid666, grid667, grid668, grid669, grid670, grid671, grid672, grid673, grid674, grid675, grid676, grid677, grid678, grid679, grid680, grid681, grid682, grid683, grid684, grid685, grid686, grid687, grid688, grid689, grid690, grid691, grid692, grid693, grid694, grid695, grid696, grid697, grid698, grid699, grid700, grid701, grid702, grid703, grid704, grid705, grid706, grid707, grid708, grid709, grid710, grid711, grid712, grid713, grid714, grid715, grid716, grid717, grid718, grid719, grid720, grid721, grid722, grid723, grid724, grid725, grid726, grid727, grid728, grid729, grid730, grid731, grid732, grid733, grid734, grid735, grid736, grid737, grid738, grid739, grid740, grid741, grid742, grid743, grid744, grid745, grid746, grid747, grid748, grid749, grid750, grid751, grid752, grid753, grid754, grid755, grid756, grid757, grid758, grid759, grid760, grid761, grid762, grid763, grid764, grid765, grid766, grid767, grid768, grid769, grid770, grid771, grid772, grid773, grid774, grid775, grid776, grid777, grid778, grid779, grid780, grid781, grid782, grid783, grid784, grid785, grid786, grid787, grid788, grid789, grid790, grid791, grid792, grid793, grid794, grid795, grid796, grid797, grid798, grid799, grid800, grid801, grid802, grid803, grid804, grid805, grid806, grid807, grid808, grid809, grid810, grid811, grid812, grid813, grid814, grid815, grid816, grid817, grid818, grid819, grid820, grid821, grid822, grid823, grid824, grid825, grid826, grid827, grid828, grid829, grid830, grid831, grid832, grid833, grid834, grid835, grid836, grid837, grid838, grid839, grid840, grid841, grid842, grid843, grid844, grid845, grid846, grid847, grid848, grid849, grid850, grid851, grid852, grid853, grid854, grid855, grid856, grid857, grid858, grid859, grid860, grid861, grid862, grid863, grid864, grid865, grid866, grid867, grid868, grid869, grid870, grid871, grid872, grid873, grid874, grid875, grid876, grid877, grid878, grid879, grid880, grid881, grid882, grid883, grid884, grid885, grid886, grid887, grid888, grid889, grid890, grid891, grid892, grid893, grid894, grid895, grid896, grid897, grid898, grid899, grid900, grid901, grid902, grid903, grid904, grid905, grid906, grid907, grid908, grid909, grid910, grid911, grid912, grid913, grid914, grid915, grid916, grid917, grid918, grid919, grid920, grid921, grid922, grid923, grid924, grid925, grid926, grid927, grid928, grid929, grid930, grid931, grid932, grid933, grid934, grid935, grid936, grid937, grid938, grid939, grid940, grid941, grid942, grid943, grid944, grid945, grid946, grid947, grid948, grid949, grid950, grid951, grid952, grid953, grid954, grid955, grid956, grid957, grid958, grid959, grid960, grid961, grid962, grid963, grid964, grid965, grid966, grid967, grid968, grid969, grid970, grid971, grid972, grid973, grid974, grid975, grid976, grid977, grid978, grid979, grid980, grid981, grid982, grid983, grid984, grid985, grid986, grid987, grid988, grid989, grid990, grid991, grid992, grid993, grid994, grid995, grid996, grid997, grid998, grid999, grid1000, grid1001, grid1002, grid1003, grid1004, grid1005, grid1006, grid1007, grid1008, grid1009, grid1010, grid1011, grid1012, grid1013, grid1014, grid1015, grid1016, grid1017, grid1018, grid1019, grid1020, grid1021, grid1022, grid1023, grid1024, grid1025, grid1026, grid1027, grid1028, grid1029, grid1030, grid1031, grid1032, grid1033, grid1034, grid1035, grid1036, grid1037, grid1038, grid1039, grid1040, grid1041, grid1042, grid1043, grid1044, grid1045, grid1046, grid1047, grid1048, grid1049, grid1050, grid1051, grid1052, grid1053, grid1054, grid1055, grid1056, grid1057, grid1058, grid1059, grid1060, grid1061, grid1062, grid1063, grid1064, grid1065, grid1066, grid1067, grid1068, grid1069, grid1070, grid1071, grid1072, grid1073, grid1074, grid1075, grid1076, grid1077, grid1078, grid1079, grid1080, grid1081, grid1082, grid1083, grid1084, grid1085, grid1086, grid1087, grid1088, grid1089, grid1090, grid1091, grid1092, grid1093, grid1094, grid1095, grid1096, grid1097, grid1098, grid1099, grid1100, grid1101, grid1102, grid1103, grid1104, grid1105, grid1106, grid1107, grid1108, grid1109, grid1110, grid1111, grid1112, grid1113, grid1114, grid1115, grid1116, grid1117, grid1118, grid1119, grid1120, grid1121, grid1122, grid1123, grid1124, grid1125, grid1126, grid1127, grid1128, grid1129, grid1130, grid1131, grid1132, grid1133, grid1134, grid1135, grid1136, grid1137, grid1138, grid1139, grid1140, grid1141, grid1142, grid1143, grid1144, grid1145, grid1146, grid1147, grid1148, grid1149, grid1150, grid1151, grid1152, grid1153, grid1154, grid1155, grid1156, grid1157, grid1158, grid1159, grid1160, grid1161, grid1162, grid1163, grid1164, grid1165, grid1166, grid1167, grid1168, grid1169, grid1170, grid1171, grid1172, grid1173, grid1174, grid1175, grid1176, grid1177, grid1178, grid1179, grid1180, grid1181, grid1182, grid1183, grid1184, grid1185, grid1186, grid1187, grid1188, grid1189, grid1190, grid1191, grid1192, grid1193, grid1194, grid1195, grid1196, grid1197, grid1198, grid1199, grid1200, grid1201, grid1202, grid1203, grid1204, grid1205, grid1206, grid1207, grid1208, grid1209, grid1210, grid1211, grid1212, grid1213, grid1214, grid1215, grid1216, grid1217, grid1218, grid1219, grid1220, grid1221, grid1222, grid1223, grid1224, grid1225, grid1226, grid1227, grid1228, grid1229, grid1230, grid1231, grid1232, grid1233, grid1234, grid1235, grid1236, grid1237, grid1238, grid1239, grid1240, grid1241, grid1242, grid1243, grid1244, grid1245, grid1246, grid1247, grid1248, grid1249, grid1250, grid1251, grid1252, grid1253, grid1254, grid1255, grid1256, grid1257, grid1258, grid1259, grid1260]):
-        key = normalize_with_exact_colors(grid)
-        if key not in patterns:
-            patterns[key] = grid
-            print(f"Pattern {len(patterns)} added:\n{grid}\n")
-        else:
-            print(f"Pattern {idx+1} is a duplicate and was skipped.\n")
-
-
-test_duplicate_removal()
+from bitgrid import decode_grid
+from engine import iter_chunks
+from fingerprint import dedupe_stack
+from patternstore import open_store, verify_store
+
+# The 1,260 reference grids (3x9; red 3x3, green 2x5, blue 1x9; every stacking
+# order, duplicates included) used to be spelled out here as grid1 ... grid1260.
+# They now live in a binary pattern store next to this file.
+REFERENCE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         "bruteforced_reference.pat")
+GRID_SIZE = (3, 9)
+SHAPES = [((3, 3), 'R'), ((2, 5), 'G'), ((1, 9), 'B')]
+
+
+def test_duplicate_removal(reference=REFERENCE, grid_size=GRID_SIZE, shapes=SHAPES,
+                           verbose=False):
+    """Dedupe the reference set and check it against the live generator.
+
+    Both are walked in one pass, chunk by chunk: each chunk of freshly
+    generated layouts is compared with the matching slice of the memory-mapped
+    reference, and the reference slice is folded into a fingerprint index.
+    Returns ``(unique, duplicates, mismatches)``.
+    """
+    if not verify_store(reference):
+        raise ValueError(f"'{reference}' failed its checksum.")
+    header, ref = open_store(reference)
+    colors = header['colors']
+
+    seen = {}
+    duplicates = []
+    mismatches = []
+    start = 0
+    for chunk in iter_chunks(grid_size, shapes, share_prefixes=False):
+        expected = ref[start:start + len(chunk)]
+        n = len(expected)
+        bad = np.flatnonzero((chunk[:n] != expected).any(axis=(1, 2)))
+        mismatches.extend(start + int(i) for i in bad)
+        mismatches.extend(range(start + n, start + len(chunk)))  # generator ran long
+        found = dedupe_stack(expected, seen, start)
+        if verbose:
+            dup_of = dict(found)
+            for i, grid in enumerate(expected, start):
+                if i in dup_of:
+                    print(f"Pattern {i + 1} is a duplicate and was skipped.\n")
+                else:
+                    print(f"Pattern {i + 1} added:\n{decode_grid(grid, colors)}\n")
+        duplicates.extend(found)
+        start += len(chunk)
+    mismatches.extend(range(start, len(ref)))  # reference has patterns left over
+
+    unique = min(start, len(ref)) - len(duplicates)
+    print(f"Reference: {len(ref)} patterns, {unique} unique, {len(duplicates)} duplicates")
+    print(f"Generator: {start} patterns, {len(mismatches)} differ from the reference")
+    for i in mismatches[:20]:
+        print(f"  mismatch at pattern {i + 1}")
+    return unique, duplicates, mismatches
+
+
+if __name__ == "__main__":
+    _, _, mismatches = test_duplicate_removal()
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,153 @@
+import json
+import os
+import time
+import numpy as np
+from bitgrid import board_to_codes, color_alphabet
+from engine import ENGINE_VERSION, iter_shard
+from fingerprint import fingerprint_stack, remember
+from parallel import make_shards
+from patternstore import (append_patterns, open_store, read_header, truncate_store,
+                          write_store)
+
+# ---------- checkpoint files -------------------------------------------------
+# A checkpointed run writes its distinct layouts to a pattern store and keeps
+# its progress next to it:
+#
+#   <out>.ckpt       JSON: the run's configuration, the next shard to run (its
+#                    stacking order and first-layer placement index) and the
+#                    counts so far
+#   <out>.ckpt.npy   the partial dedupe index: the fingerprint of every layout
+#                    already in the store, in store order
+#
+# Shards are the (order, first placement) units of parallel.make_shards, taken
+# in order, so layouts keep the order-by-order numbering of the original
+# scripts.  Progress is only ever recorded at a shard boundary and only after
+# the store holds that shard's layouts; on resume the store is cut back to the
+# checkpoint, so a run killed at any moment loses at most one interval.
+
+
+def _checkpoint_paths(out_path):
+    return out_path + '.ckpt', out_path + '.ckpt.npy'
+
+
+def _save_checkpoint(out_path, state, fps):
+    meta, index = _checkpoint_paths(out_path)
+    tmp = index + '.tmp.npy'
+    np.save(tmp, np.asarray(fps, dtype=np.uint64))
+    os.replace(tmp, index)
+    tmp = meta + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=1)
+    os.replace(tmp, meta)
+
+
+def load_checkpoint(out_path):
+    """(state, fingerprints) of a run's checkpoint, or None if there is none."""
+    meta, index = _checkpoint_paths(out_path)
+    if not os.path.exists(meta):
+        return None
+    with open(meta) as f:
+        state = json.load(f)
+    return state, np.load(index)
+
+
+def _config(grid_size, shapes, require_visible, exact):
+    return {'grid_size': list(grid_size),
+            'shapes': [[list(shape), color] for shape, color in shapes],
+            'require_visible': bool(require_visible),
+            'exact': bool(exact),
+            'engine_version': ENGINE_VERSION}
+
+
+def _rebuild_index(out_path, fps, exact):
+    """Dedupe index (see fingerprint.remember) of the layouts already stored."""
+    seen = {}
+    _, records = open_store(out_path)
+    for i, fp in enumerate(fps.tolist()):
+        seen.setdefault(fp, []).append((records[i].tobytes() if exact else None, i))
+    return seen
+
+# ---------- checkpointed enumeration -----------------------------------------
+def _shard_stack(grid_size, boards):
+    rows, cols = grid_size
+    grids = [board_to_codes(board, grid_size) for board in boards]
+    if not grids:
+        return np.empty((0, rows, cols), dtype=np.uint8)
+    return np.stack(grids)
+
+
+def enumerate_checkpointed(grid_size, shapes, out_path, require_visible=False,
+                           exact=True, interval=60.0, verbose=False):
+    """Write the distinct layouts to a store, checkpointing every ``interval`` s.
+
+    Rerunning with the same arguments after a crash or kill resumes from the
+    last checkpoint instead of starting over; a finished run returns at once.
+    Returns the counts dict (total, unique, duplicates).  Raises ValueError if
+    ``out_path`` belongs to a run with a different configuration.
+    """
+    config = _config(grid_size, shapes, require_visible, exact)
+    shards = make_shards(grid_size, shapes)
+    found = load_checkpoint(out_path)
+    if found is None:
+        state = {'config': config, 'order': None, 'first': None, 'next_shard': 0,
+                 'total': 0, 'unique': 0, 'duplicates': 0, 'done': False}
+        write_store(out_path, [], grid_size, color_alphabet(shapes))
+        fps = []
+        seen = {}
+        _save_checkpoint(out_path, state, fps)
+    else:
+        state, saved = found
+        if state['config'] != config:
+            raise ValueError(f"'{out_path}' holds a run with a different configuration.")
+        if read_header(out_path)['count'] > state['unique']:
+            truncate_store(out_path, state['unique'])   # drop work after the checkpoint
+        saved = saved[:state['unique']]   # index may be saved ahead of the state
+        fps = saved.tolist()
+        seen = _rebuild_index(out_path, saved, exact)
+        if verbose and not state['done']:
+            print(f"Resuming at shard {state['next_shard']} of {len(shards)} "
+                  f"(order {state['order']}, placement {state['first']})")
+
+    last_save = time.monotonic()
+    for k in range(state['next_shard'], len(shards)):
+        order, first = shards[k]
+        stack = _shard_stack(grid_size, iter_shard(grid_size, shapes, order, first,
+                                                   require_visible))
+        keep = []
+        for i, (grid, fp) in enumerate(zip(stack, fingerprint_stack(stack))):
+            fp = int(fp)
+            if remember(seen, fp, grid, state['unique'] + len(keep), exact) is None:
+                keep.append(i)
+                fps.append(fp)
+        state['total'] += len(stack)
+        state['duplicates'] += len(stack) - len(keep)
+        if keep:
+            append_patterns(out_path, stack[keep])
+        state['unique'] += len(keep)
+        state['next_shard'] = k + 1
+        if k + 1 < len(shards):
+            state['order'], state['first'] = list(shards[k + 1][0]), shards[k + 1][1]
+        if time.monotonic() - last_save >= interval:
+            _save_checkpoint(out_path, state, fps)
+            last_save = time.monotonic()
+    state['done'] = True
+    state['order'] = state['first'] = None
+    _save_checkpoint(out_path, state, fps)
+    return {name: state[name] for name in ('total', 'unique', 'duplicates')}
+
+# ---------- driver -----------------------------------------------------------
+def main():
+    grid_size = (3, 9)
+    shapes = [((3, 3), 'R'),   # red square
+              ((2, 5), 'G'),   # green rectangle
+              ((1, 9), 'B'),   # blue rectangle
+              ((1, 3), 'Y')]   # yellow bar
+
+    counts = enumerate_checkpointed(grid_size, shapes, "four_shapes_3x9.pat",
+                                    interval=5.0, verbose=True)
+    print(f"Shapes: {len(shapes)}  grid: {grid_size}")
+    print(f"Total patterns generated: {counts['total']}")
+    print(f"Total unique patterns : {counts['unique']}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,34 @@
+import os
 import numpy as np
 import re, ast
+from patternstore import is_store, open_store, unpack_records
+from legacyformats import read_legacy
 
 def normalize_with_exact_colors(grid):
-    return ''.join(grid.flatten())
+    if grid.dtype.kind == 'U':
+        return ''.join(grid.flatten())
+    # uint8 code grids (pattern store or legacy reader): the raw cells are the key
+    return grid.tobytes()
+
+def load_patterns(filename="patterns2.pat"):
+    """Open a binary pattern store memory-mapped, or stream-parse a text archive.
+
+    Text archives in either legacy format ('Pattern N:' blocks or
+    'gridN = np.array([...])' blocks) are detected automatically.
+
+    An unpacked store is not read up front: the returned array is a view onto
+    the file and each pattern is paged in only when it is used.  A bit-packed
+    store is expanded in full.
+
+    If a ``.pat`` store has not been written yet (npgrid.main creates it), the
+    text archive of the same name is read instead.
+    """
+    if filename.endswith('.pat') and not os.path.exists(filename):
+        filename = filename[:-len('.pat')] + '.txt'
+    if is_store(filename):
+        header, records = open_store(filename)
+        return unpack_records(header, records)
+    return read_legacy(filename)
 
 def load_patterns_from_file(filename="patterns2.txt"):
     with open(filename, 'r') as f:
@@ -22,9 +48,12 @@ def load_patterns_from_file(filename="patterns2.txt"):
     return patterns
 
 def dedupe_patterns(patterns):
+    """Dedupe any iterable of grids, including a generator stream."""
     patterns_dict = {}
     kept = []
+    total = 0
     for idx, grid in enumerate(patterns, 1):
+        total = idx
         key = normalize_with_exact_colors(grid)
         if key not in patterns_dict:
             patterns_dict[key] = grid
@@ -32,9 +61,9 @@ def dedupe_patterns(patterns):
             print(f"✅ Pattern {idx} added")
         else:
             print(f"❌ Pattern {idx} is a duplicate and was skipped.")
-    print(f"\nSummary: {len(patterns)} total, {len(kept)} unique, {len(patterns)-len(kept)} duplicates skipped")
+    print(f"\nSummary: {total} total, {len(kept)} unique, {total-len(kept)} duplicates skipped")
     return kept
 
 if __name__ == "__main__":
-    patterns = load_patterns_from_file("patterns2.txt")
+    patterns = load_patterns()
     kept = dedupe_patterns(patterns)
@@ -0,0 +1,237 @@
+import time
+from functools import lru_cache
+from bitgrid import color_alphabet, rect_mask
+from engine import iter_boards
+from placements import placement_table
+
+# ---------- why this counts each layout once ---------------------------------
+# Read a finished layout from the top down.  A shape can be "peeled" off once
+# some placement R of it satisfies  visible ⊆ R ⊆ visible ∪ covered, where
+# covered is everything already peeled.  Peeling only grows ``covered``, so a
+# shape that can be peeled stays peelable, and peeling the smallest peelable
+# shape index at every step reaches the bottom whenever any stacking does.
+# That greedy peel is the one canonical stacking of the layout.
+#
+# Building top-down, the shape placed under ``covered`` shows exactly
+# R & ~covered, and two placements that show the same cells give the same
+# layout.  So each step branches over the distinct visible regions rather than
+# over placements, and the canonical-order rule becomes: a shape j that was
+# skipped while a larger index was peeled at ``covered = C`` must not have been
+# peelable then, i.e. its visible region must not be one of {R & ~C}.
+
+def _check_colors(shapes):
+    colors = [color for _, color in shapes]
+    if len(set(colors)) != len(colors):
+        raise ValueError(f"Counting needs one distinct color per shape, got {colors}.")
+
+def _mirror_classes(grid_size, shape):
+    """(placement mask, class size) for a shape's placements up to mirroring.
+
+    Classes are taken under both flips and the half turn of the grid, and each
+    is represented by its smallest mask.
+    """
+    rows, cols = grid_size
+    sizes = {}
+    for (h, w), r, c in placement_table(grid_size, shape).placements:
+        images = [rect_mask(grid_size, r2, c2, (h, w))
+                  for r2 in (r, rows - r - h) for c2 in (c, cols - c - w)]
+        top = min(images)
+        sizes[top] = sizes.get(top, 0) + 1
+    return list(sizes.items())
+
+def count_layouts(grid_size, shapes, require_visible=False):
+    """Number of distinct layouts over every stacking order, without grids.
+
+    ``shapes`` is a list of (shape, color) pairs with distinct colors.  With
+    ``require_visible`` only layouts in which every shape shows at least one
+    cell are counted.  Memoized over (covered cells, shapes left, per-shape
+    peel constraint), so shared sub-stackings are counted once.
+    """
+    _check_colors(shapes)
+    masks = [placement_table(grid_size, shape).bitmasks for shape, _ in shapes]
+
+    @lru_cache(maxsize=None)
+    def blocked_regions(i, covered):
+        """Regions shape i could already have been peeled with (cached per C)."""
+        return frozenset(map((~covered).__and__, masks[i]))
+
+    @lru_cache(maxsize=None)
+    def overlapping(i, rect):
+        """Placements of shape i that share a cell with the full placement ``rect``."""
+        return frozenset(m for m in masks[i] if m & rect)
+
+    # The last layer is reached once per path, so it is counted rather than
+    # enumerated.  ``covered`` is the union of the full placements above (a
+    # shape's visible cells plus what was covered before make up its whole
+    # rectangle), so only placements overlapping one of those can be partly
+    # hidden.  Every other placement shows its whole rectangle, which no
+    # placement of the same area can match: each is a layout of its own
+    # unless a peel constraint B is set, and B lies inside ``covered``, so
+    # such a placement was peelable at B and is ruled out.  The same goes for
+    # one that only overlaps placements lying inside B: it shows R & ~B.
+    def last(i, covered, rects, blocked):
+        """Distinct layouts from placing the final shape i beneath ``covered``."""
+        if blocked is not None:
+            rects = [rect for rect in rects if rect & ~blocked]
+        touching = set().union(*[overlapping(i, rect) for rect in rects])
+        options = set(map((~covered).__and__, touching))
+        if blocked is None:
+            free = len(masks[i]) - len(touching)
+        else:
+            free = 0
+            options = options - blocked_regions(i, blocked)
+        return free + len(options) - (require_visible and 0 in options)
+
+    memo = {}
+
+    def count(covered, remaining, blocked, rects=()):
+        # ``rects`` only feeds ``last`` and stays out of the memo key: any list
+        # of placements whose union is ``covered`` gives the same answer.
+        key = (covered, remaining, blocked)
+        if key in memo:
+            return memo[key]
+        if len(remaining) == 1:
+            return last(remaining[0], covered, rects, blocked[0])
+        total = 0
+        for pos, i in enumerate(remaining):
+            options = {}                # visible region -> a placement showing it
+            for mask in masks[i]:
+                options.setdefault(mask & ~covered, mask)
+            if blocked[pos] is not None:
+                gone = blocked_regions(i, blocked[pos])
+                options = {v: m for v, m in options.items() if v not in gone}
+            rest = remaining[:pos] + remaining[pos + 1:]
+            rest_blocked = tuple(covered if j < i else b
+                                 for j, b in zip(rest, blocked[:pos] + blocked[pos + 1:]))
+            for visible, mask in options.items():
+                if require_visible and not visible:
+                    continue
+                if len(rest) == 1:
+                    # the final layer is never revisited, so skip the memo table
+                    total += last(rest[0], covered | visible, rects + (mask,), rest_blocked[0])
+                else:
+                    total += count(covered | visible, rest, rest_blocked, rects + (mask,))
+        memo[key] = total
+        return total
+
+    # The top layer is expanded here rather than in ``count``.  A mirror image
+    # of a layout (either flip, or the half turn) is counted exactly like it:
+    # every shape's placements are closed under those moves and the peel rule
+    # only looks at cells and shape indices.  So each top placement's subtree
+    # is counted once per mirror class and weighted by the class size.
+    n = len(shapes)
+    if n == 1:
+        return len(masks[0])
+    total = 0
+    for i in range(n):
+        rest = tuple(j for j in range(n) if j != i)
+        rest_blocked = tuple(0 if j < i else None for j in rest)
+        for top, weight in _mirror_classes(grid_size, shapes[i][0]):
+            if n == 2:
+                total += weight * last(rest[0], top, (top,), rest_blocked[0])
+            else:
+                total += weight * count(top, rest, rest_blocked, (top,))
+    return total
+
+# ---------- orderly generation -----------------------------------------------
+# The same top-down walk, but producing the layouts instead of counting them.
+# A board (see bitgrid.py) holds exactly the visible cells of each colour, so
+# the visible regions chosen along a path *are* the layout.  The peel rule
+# admits only the canonical stacking of each layout, so every distinct layout
+# comes out exactly once, with no seen-set and no dedupe afterwards.
+
+def canonical_tops(grid_size, shapes, require_visible=False):
+    """Every (shape index, visible region) the top shape can take, in order.
+
+    These split orderly generation into disjoint shards: the layouts of
+    different tops never coincide, so shard results need no merge-time dedupe.
+    """
+    _check_colors(shapes)
+    tops = []
+    for i, (shape, _) in enumerate(shapes):
+        for visible in sorted(set(placement_table(grid_size, shape).bitmasks)):
+            if visible or not require_visible:
+                tops.append((i, visible))
+    return tops
+
+def iter_canonical_boards(grid_size, shapes, require_visible=False, top=None):
+    """Yield every distinct layout exactly once, as a board.
+
+    ``shapes`` is a list of (shape, color) pairs with distinct colors.  With
+    ``top`` (one of ``canonical_tops``) only the layouts with that top shape
+    and region are produced.  Memory is the recursion depth, however many
+    layouts there are.
+    """
+    _check_colors(shapes)
+    colors = color_alphabet(shapes)
+    codes = [colors.index(color) for _, color in shapes]
+    masks = [placement_table(grid_size, shape).bitmasks for shape, _ in shapes]
+    planes = [0] * (len(colors) - 1)
+
+    @lru_cache(maxsize=None)
+    def blocked_regions(i, covered):
+        return frozenset(map((~covered).__and__, masks[i]))
+
+    def walk(covered, remaining, blocked, first=None):
+        for pos, i in enumerate(remaining):
+            if first is not None and i != first[0]:
+                continue
+            options = set(map((~covered).__and__, masks[i]))
+            if blocked[pos] is not None:
+                options -= blocked_regions(i, blocked[pos])
+            if first is not None:
+                options &= {first[1]}
+            rest = remaining[:pos] + remaining[pos + 1:]
+            rest_blocked = tuple(covered if j < i else b
+                                 for j, b in zip(rest, blocked[:pos] + blocked[pos + 1:]))
+            for visible in sorted(options):
+                if require_visible and not visible:
+                    continue
+                planes[codes[i] - 1] = visible
+                if rest:
+                    yield from walk(covered | visible, rest, rest_blocked)
+                else:
+                    yield tuple(planes)
+            planes[codes[i] - 1] = 0
+
+    n = len(shapes)
+    yield from walk(0, tuple(range(n)), (None,) * n, top)
+
+# ---------- cross-check ------------------------------------------------------
+def brute_force_count(grid_size, shapes, require_visible=False):
+    """Distinct layouts by full enumeration and dedupe (small cases only)."""
+    seen = set()
+    for board in iter_boards(grid_size, shapes, require_visible):
+        seen.add(board)
+    return len(seen)
+
+def cross_check(grid_size, shapes, require_visible=False):
+    """Compare the counter with brute force; returns (counted, brute force)."""
+    counted = count_layouts(grid_size, shapes, require_visible)
+    brute = brute_force_count(grid_size, shapes, require_visible)
+    if counted != brute:
+        print(f"Mismatch for {grid_size} {shapes}: counted {counted}, brute force {brute}")
+    return counted, brute
+
+# ---------- driver -----------------------------------------------------------
+def main():
+    shapes = [((3, 3), 'R'),   # red square
+              ((2, 5), 'G'),   # green rectangle
+              ((1, 9), 'B')]   # blue rectangle
+
+    print("Cross-check against brute force:")
+    for grid_size in [(3, 9), (4, 9), (3, 10), (4, 10)]:
+        for require_visible in (False, True):
+            counted, brute = cross_check(grid_size, shapes, require_visible)
+            status = "ok" if counted == brute else "MISMATCH"
+            print(f"  {grid_size} visible={require_visible}: {counted} vs {brute}  {status}")
+
+    print("\nSweep (every shape visible):")
+    for rows in range(3, 11):
+        for cols in (9, 18, 30):
+            start = time.perf_counter()
+            total = count_layouts((rows, cols), shapes, require_visible=True)
+            print(f"  {rows}x{cols}: {total} unique patterns  ({time.perf_counter() - start:.2f}s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import struct
+import numpy as np
+
+# ---------- pairs file layout ------------------------------------------------
+# Duplicate pairs are written twice as they stream in: as the human-readable
+# CSV the scripts always produced ("Duplicate Index,Original Index") and as a
+# compact binary file:
+#
+#   magic     8s   b'DUPPAIRS'
+#   version   u16
+#   itemsize  u16  bytes per index: 4 (uint32) or 8 (uint64)
+#   count     u64  number of pairs
+#   (padding to 32 bytes)
+#
+# followed by ``count`` (duplicate, original) pairs of little-endian unsigned
+# integers, so the file can be memory-mapped as a (count, 2) array.
+MAGIC = b'DUPPAIRS'
+VERSION = 1
+HEADER_FORMAT = '<8sHHQ'
+HEADER_SIZE = 32
+CSV_HEADER = "Duplicate Index,Original Index\n"
+
+
+def _pack_header(itemsize, count):
+    return struct.pack(HEADER_FORMAT, MAGIC, VERSION, itemsize, count).ljust(HEADER_SIZE, b'\0')
+
+
+def _dtype(itemsize):
+    if itemsize not in (4, 8):
+        raise ValueError(f"Index size must be 4 or 8 bytes, got {itemsize}.")
+    return np.dtype(f'<u{itemsize}')
+
+
+def _flush(block, csv_file, bin_file, dtype):
+    if len(block) and block.max() > np.iinfo(dtype).max:
+        raise ValueError(f"Index {block.max()} does not fit in {dtype.itemsize} bytes.")
+    if csv_file is not None:
+        csv_file.write(''.join(f"{d},{o}\n" for d, o in block.tolist()))
+    if bin_file is not None:
+        bin_file.write(block.astype(dtype).tobytes())
+
+# ---------- writing ----------------------------------------------------------
+def write_pairs(pairs, csv_path=None, bin_path=None, itemsize=4, buffer_size=65536):
+    """Stream (duplicate, original) pairs to a CSV and/or binary pairs file.
+
+    ``pairs`` can be a generator; pairs are buffered ``buffer_size`` at a time
+    and written out block by block, so memory stays flat however many there
+    are.  Returns the number of pairs written.
+    """
+    dtype = _dtype(itemsize)
+    csv_file = open(csv_path, 'w', newline='') if csv_path else None
+    bin_file = open(bin_path, 'wb') if bin_path else None
+    count = 0
+    try:
+        if csv_file is not None:
+            csv_file.write(CSV_HEADER)
+        if bin_file is not None:
+            bin_file.write(_pack_header(itemsize, 0))
+        block = np.empty((buffer_size, 2), dtype=np.int64)
+        n = 0
+        for duplicate, original in pairs:
+            block[n] = duplicate, original
+            n += 1
+            if n == buffer_size:
+                _flush(block, csv_file, bin_file, dtype)
+                count += n
+                n = 0
+        _flush(block[:n], csv_file, bin_file, dtype)
+        count += n
+        if bin_file is not None:
+            bin_file.seek(0)
+            bin_file.write(_pack_header(itemsize, count))
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+        if bin_file is not None:
+            bin_file.close()
+    return count
+
+# ---------- reading ----------------------------------------------------------
+def read_pairs(path):
+    """Memory-map a binary pairs file as a read-only (count, 2) array."""
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("File is too short to be a pairs file.")
+    magic, version, itemsize, count = struct.unpack_from(HEADER_FORMAT, raw)
+    if magic != MAGIC:
+        raise ValueError("Not a pairs file (bad magic).")
+    if version != VERSION:
+        raise ValueError(f"Unsupported pairs file version {version}.")
+    dtype = _dtype(itemsize)
+    if count == 0:
+        return np.empty((0, 2), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=HEADER_SIZE, shape=(count, 2))
@@ -0,0 +1,244 @@
+import numpy as np
+from itertools import chain, permutations
+from bitgrid import (check_visible_colors, color_alphabet, empty_board, place_mask,
+                     board_to_codes, decode_board)
+from placements import placement_table
+
+# Bump whenever a change alters which layouts come out or in what order, so
+# results cached by an older engine are never reused.
+ENGINE_VERSION = 2
+
+# ---------- helpers ----------------------------------------------------------
+def shape_layers(grid_size, shapes, colors):
+    """(code, placement masks) for every (shape, color) pair.
+
+    The masks come from the cached placement tables, so only valid placements
+    are ever visited and no layer re-derives them.
+    """
+    return [(colors.index(color), placement_table(grid_size, shape).bitmasks)
+            for shape, color in shapes]
+
+def order_trie(orders):
+    """Nest stacking orders into a prefix tree: {idx: {idx: {...}}}.
+
+    Orders that start the same way share a branch, so the layouts of a shared
+    prefix are built once and then extended by every order below it.
+    """
+    trie = {}
+    for order in orders:
+        node = trie
+        for idx in order:
+            node = node.setdefault(idx, {})
+    return trie
+
+# ---------- visibility tracking ----------------------------------------------
+def visible_counts(board):
+    """Visible cell count per colour plane of a board."""
+    return tuple(plane.bit_count() for plane in board)
+
+def place_tracked(board, counts, mask, code):
+    """Place ``mask`` in colour ``code`` and update the visible counts.
+
+    Only the cells the new shape hides are counted, so the update costs one
+    AND and one popcount per colour instead of a scan of the whole grid.
+    """
+    new_board = []
+    new_counts = []
+    for i, (plane, n) in enumerate(zip(board, counts)):
+        if i == code - 1:
+            plane |= mask
+            new_board.append(plane)
+            new_counts.append(plane.bit_count())
+        else:
+            hidden = plane & mask
+            new_board.append(plane ^ hidden)
+            new_counts.append(n - hidden.bit_count() if hidden else n)
+    return tuple(new_board), tuple(new_counts)
+
+def buries_a_shape(counts, new_counts):
+    """True if a shape that was showing has just been hidden completely.
+
+    A hidden shape never shows again (later shapes only cover more cells), so
+    every layout below this placement would fail the visibility requirement.
+    """
+    return any(n and not m for n, m in zip(counts, new_counts))
+
+def _dfs(board, layers, trie, require_visible, counts=None, path=None):
+    """Depth-first walk over an order trie, yielding finished boards.
+
+    With ``require_visible`` every shape must keep at least one visible cell;
+    placements that bury an earlier shape are cut before their subtree is
+    expanded.  With a ``path`` tuple (start with ``()``) each board comes out
+    as ``(board, path)``, where path lists the (shape index, placement index)
+    of every layer, bottom to top.
+    """
+    if not trie:
+        yield board if path is None else (board, path)
+        return
+    if require_visible and counts is None:
+        counts = visible_counts(board)
+    for idx, sub in trie.items():
+        code, masks = layers[idx]
+        for p, mask in enumerate(masks):
+            step = None if path is None else path + ((idx, p),)
+            if require_visible:
+                placed, new_counts = place_tracked(board, counts, mask, code)
+                if buries_a_shape(counts, new_counts):
+                    continue
+                yield from _dfs(placed, layers, sub, require_visible, new_counts, step)
+            else:
+                yield from _dfs(place_mask(board, mask, code), layers, sub, False, None, step)
+
+# ---------- partial-order reduction ------------------------------------------
+# Placing two shapes whose masks do not overlap gives the same board in either
+# order, so the full permutation tree reaches most layouts many times over.
+# Sleep sets (as in model checkers) cut those repeats: once a placement has
+# been explored at a node, every later sibling branch puts it to sleep for as
+# long as the branch only places masks disjoint from it, since the earlier
+# branch already covers that interleaving.  A different shape or an
+# overlapping mask wakes it up again.  Every layout is still produced, just
+# far fewer times, before any hashing happens.
+
+def _dfs_reduced(board, layers, remaining, sleep, require_visible, counts=None):
+    """Depth-first walk over every order of ``remaining`` with sleep sets.
+
+    ``sleep`` maps shape index -> masks that need not be placed here.
+    """
+    if not remaining:
+        yield board
+        return
+    if require_visible and counts is None:
+        counts = visible_counts(board)
+    explored = {}
+    for idx in remaining:
+        code, masks = layers[idx]
+        asleep = sleep.get(idx, ())
+        rest = tuple(j for j in remaining if j != idx)
+        done = explored[idx] = []
+        for mask in masks:
+            if mask in asleep:
+                continue
+            done.append(mask)
+            if require_visible:
+                placed, new_counts = place_tracked(board, counts, mask, code)
+                if buries_a_shape(counts, new_counts):
+                    continue
+            else:
+                placed, new_counts = place_mask(board, mask, code), None
+            if not rest:
+                yield placed
+                continue
+            child_sleep = {j: {m for m in chain(sleep.get(j, ()), explored.get(j, ()))
+                               if not m & mask}
+                           for j in rest}
+            yield from _dfs_reduced(placed, layers, rest, child_sleep, require_visible,
+                                    new_counts)
+
+# ---------- streaming enumeration --------------------------------------------
+def iter_boards(grid_size, shapes, require_visible=False, orders=None,
+                share_prefixes=True, partial_order=False, with_placements=False):
+    """Yield every layout (duplicates included) as a board, one at a time.
+
+    ``shapes`` is any number of (shape, color) pairs and ``orders`` the
+    stacking orders to expand (default: every permutation).  With
+    ``require_visible`` only layouts in which every shape still shows at least
+    one cell are produced, pruned as soon as a shape is buried; visibility is
+    tracked per colour, so this needs one distinct colour per shape.  Only one
+    partial layout per layer is alive at any moment, so memory stays constant
+    however many layouts there are.
+
+    With ``share_prefixes`` the orders are walked as a prefix tree and layouts
+    come out grouped by shared prefix.  Without it each order is expanded on
+    its own, which redoes the prefix work but reproduces the order-by-order
+    pattern numbering of the original scripts.
+
+    With ``partial_order`` stackings that differ only by swapping shapes with
+    disjoint placements are expanded once (see ``_dfs_reduced``).  Every
+    distinct layout still comes out, but duplicates are mostly gone, so the
+    total is smaller.  Only valid over every permutation (``orders=None``).
+
+    With ``with_placements`` each layout comes out as ``(board, path)``, where
+    path is the (shape index, placement index) of every layer, bottom to top;
+    placement indices index the shape's placement table.
+    """
+    if require_visible:
+        check_visible_colors(shapes)
+    colors = color_alphabet(shapes)
+    layers = shape_layers(grid_size, shapes, colors)
+    path = () if with_placements else None
+    if partial_order:
+        if orders is not None:
+            raise ValueError("partial_order needs every stacking order (orders=None).")
+        if with_placements:
+            raise ValueError("partial_order does not report placements.")
+        yield from _dfs_reduced(empty_board(len(colors)), layers, tuple(range(len(shapes))),
+                                {}, require_visible)
+        return
+    if orders is None:
+        orders = permutations(range(len(shapes)))
+    if share_prefixes:
+        yield from _dfs(empty_board(len(colors)), layers, order_trie(orders),
+                        require_visible, path=path)
+        return
+    for order in orders:
+        yield from _dfs(empty_board(len(colors)), layers, order_trie([order]),
+                        require_visible, path=path)
+
+def iter_shard(grid_size, shapes, order, first, require_visible=False):
+    """Yield the layouts of one (order, first-shape placement) shard.
+
+    ``first`` indexes the first shape's placement masks; the shards of every
+    ``first`` for every order partition the full enumeration.
+    """
+    if require_visible:
+        check_visible_colors(shapes)
+    colors = color_alphabet(shapes)
+    layers = shape_layers(grid_size, shapes, colors)
+    code, masks = layers[order[0]]
+    board = place_mask(empty_board(len(colors)), masks[first], code)
+    yield from _dfs(board, layers, order_trie([order[1:]]), require_visible)
+
+def iter_patterns(grid_size, shapes, require_visible=False, **kwargs):
+    """Yield every layout as a string grid, one at a time."""
+    colors = color_alphabet(shapes)
+    for board in iter_boards(grid_size, shapes, require_visible, **kwargs):
+        yield decode_board(board, grid_size, colors)
+
+def iter_chunks(grid_size, shapes, chunk_size=4096, require_visible=False, **kwargs):
+    """Yield layouts as uint8 code stacks of at most ``chunk_size`` grids."""
+    rows, cols = grid_size
+    chunk = np.empty((chunk_size, rows, cols), dtype=np.uint8)
+    n = 0
+    for board in iter_boards(grid_size, shapes, require_visible, **kwargs):
+        chunk[n] = board_to_codes(board, grid_size)
+        n += 1
+        if n == chunk_size:
+            yield chunk.copy()
+            n = 0
+    if n:
+        yield chunk[:n].copy()
+
+def count_unique(grid_size, shapes, require_visible=False, **kwargs):
+    """(total layouts, distinct layouts) for any number of shapes."""
+    total = 0
+    seen = set()
+    for board in iter_boards(grid_size, shapes, require_visible, **kwargs):
+        total += 1
+        seen.add(board)
+    return total, len(seen)
+
+# ---------- driver -----------------------------------------------------------
+def main():
+    grid_size = (3, 9)
+    shapes = [((3, 3), 'R'),   # red square
+              ((2, 5), 'G'),   # green rectangle
+              ((1, 9), 'B'),   # blue rectangle
+              ((1, 3), 'Y')]   # yellow bar
+
+    total, unique = count_unique(grid_size, shapes)
+    print(f"Shapes: {len(shapes)}  grid: {grid_size}")
+    print(f"Total patterns generated: {total}")
+    print(f"Total unique patterns : {unique}")
+
+if __name__ == "__main__":
+    main()
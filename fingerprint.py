@@ -0,0 +1,121 @@
+import numpy as np
+from bitgrid import bits_per_cell, pack_codes
+
+# ---------- fingerprints -----------------------------------------------------
+# Dedupe keys computed straight from uint8 code grids (see bitgrid.py) instead
+# of joining every cell into a string and running md5 over it.
+_SEED = np.uint64(0xCBF29CE484222325)
+_MUL = np.uint64(0x100000001B3)
+_MIX1 = np.uint64(0xFF51AFD7ED558CCD)
+_MIX2 = np.uint64(0xC4CEB9FE1A85EC53)
+
+
+def _as_rows(stack, align):
+    """(N, cells) uint8 view of a stack, zero-padded to a multiple of align."""
+    stack = np.asarray(stack, dtype=np.uint8)
+    flat = stack.reshape(len(stack), -1)
+    pad = (-flat.shape[1]) % align
+    if pad:
+        flat = np.concatenate([flat, np.zeros((len(flat), pad), dtype=np.uint8)], axis=1)
+    return np.ascontiguousarray(flat)
+
+
+def fingerprint_stack(stack):
+    """64-bit fingerprint of every grid in an (N, rows, cols) stack at once.
+
+    The cells are read eight at a time as little-endian uint64 words and folded
+    with a multiply/xor-shift mix, vectorized across the whole stack.  Not
+    cryptographic; pair it with ``remember`` when collisions must be ruled out.
+    """
+    stack = np.asarray(stack, dtype=np.uint8)
+    n_cells = int(np.prod(stack.shape[1:]))
+    rows = _as_rows(stack, 8)
+    words = rows.view('<u8')
+    h = np.full(len(rows), _SEED, dtype=np.uint64)
+    for w in words.T:
+        h ^= w
+        h *= _MUL
+        h ^= h >> np.uint64(29)
+    h ^= np.uint64(n_cells)
+    h ^= h >> np.uint64(33)
+    h *= _MIX1
+    h ^= h >> np.uint64(33)
+    h *= _MIX2
+    h ^= h >> np.uint64(33)
+    return h
+
+
+def fingerprint(grid):
+    """64-bit fingerprint of a single uint8 code grid."""
+    return int(fingerprint_stack(np.asarray(grid)[None])[0])
+
+
+def packed_keys(stack, n_colors):
+    """Exact packed-integer key for every grid in a stack.
+
+    Cells are packed ``bits_per_cell(n_colors)`` bits each (2 bits for the
+    usual E/R/G/B alphabet), so two grids share a key only if they are equal.
+    """
+    packed = pack_codes(stack, bits_per_cell(n_colors))
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def packed_key(grid, n_colors):
+    """Exact packed-integer key of a single uint8 code grid."""
+    return packed_keys(np.asarray(grid)[None], n_colors)[0]
+
+# ---------- dedupe index -----------------------------------------------------
+def remember(seen, fp, grid, index, exact=True):
+    """Record a grid in a fingerprint index and report an earlier copy.
+
+    ``seen`` maps fingerprint -> list of (cells, index).  Returns the index of
+    an identical grid recorded earlier, or None after recording this one.  With
+    ``exact`` the cell bytes are compared on every fingerprint hit, so a 64-bit
+    collision is kept as a separate grid instead of being merged.
+    """
+    cells = np.asarray(grid).tobytes() if exact else None
+    bucket = seen.get(fp)
+    if bucket is None:
+        seen[fp] = [(cells, index)]
+        return None
+    for other, other_index in bucket:
+        if not exact or other == cells:
+            return other_index
+    bucket.append((cells, index))
+    return None
+
+
+def dedupe_stack(stack, seen, start=0, exact=True):
+    """Fingerprint a whole stack and fold it into ``seen``.
+
+    Grid ``i`` of the stack gets index ``start + i``.  Returns the list of
+    (dup_index, original_index) pairs found in this stack.
+    """
+    duplicates = []
+    for i, (grid, fp) in enumerate(zip(stack, fingerprint_stack(stack))):
+        original = remember(seen, int(fp), grid, start + i, exact)
+        if original is not None:
+            duplicates.append((start + i, original))
+    return duplicates
+
+# ---------- colour-invariant keys --------------------------------------------
+def relabel_colors(stack):
+    """Renumber each grid's colours by order of first appearance (row-major).
+
+    Empty (code 0) stays 0; the first non-empty colour met becomes 1, the
+    next new one 2, and so on.  Two layouts that differ only by which colour
+    is which come out identical, so any key of the result (``fingerprint_stack``,
+    ``packed_keys``, bytes) is invariant under colour interchange.  Done for
+    the whole (N, rows, cols) stack at once: one pass over the cells per code.
+    """
+    stack = np.asarray(stack, dtype=np.uint8)
+    n_cells = int(np.prod(stack.shape[1:]))
+    flat = stack.reshape(len(stack), n_cells)
+    n_codes = int(flat.max()) + 1 if flat.size else 1
+    cells = np.arange(n_cells)
+    first = np.full((len(flat), n_codes), n_cells)
+    for code in range(1, n_codes):
+        first[:, code] = np.where(flat == code, cells, n_cells).min(axis=1)
+    first[:, 0] = -1                                    # empty always sorts first
+    lut = np.argsort(np.argsort(first, axis=1, kind='stable'), axis=1).astype(np.uint8)
+    return np.take_along_axis(lut, flat.astype(np.intp), axis=1).reshape(stack.shape)
@@ -0,0 +1,106 @@
+import numpy as np
+from bitgrid import DEFAULT_COLORS, encode_grid
+
+# ---------- colour lookup ----------------------------------------------------
+# Whole stacks of grids are rendered at once: the uint8 codes (see bitgrid.py)
+# index an (n_colors, 3) RGB table, so a stack of N grids becomes an
+# (N, rows, cols, 3) image array in one fancy-indexing call, with no per-cell
+# Python loop and no matplotlib figure per pattern.
+PALETTE = {'E': (255, 255, 255),   # empty: white
+           'R': (255, 0, 0),
+           'G': (0, 255, 0),
+           'B': (0, 0, 255),
+           'Y': (255, 255, 0)}
+UNKNOWN = (128, 128, 128)          # any colour missing from PALETTE
+BACKGROUND = (64, 64, 64)          # gaps between tiles
+
+
+def color_lut(colors=DEFAULT_COLORS):
+    """(n_colors, 3) uint8 RGB table for an alphabet."""
+    return np.array([PALETTE.get(c, UNKNOWN) for c in colors], dtype=np.uint8)
+
+
+def _as_codes(stack, colors):
+    stack = np.asarray(stack)
+    if stack.dtype.kind in 'US':   # string grids from the older scripts
+        return encode_grid(stack, colors)
+    return stack.astype(np.uint8, copy=False)
+
+
+def stack_to_rgb(stack, colors=DEFAULT_COLORS, scale=1):
+    """RGB image of every grid: (N, rows, cols) -> (N, rows*scale, cols*scale, 3).
+
+    ``stack`` holds uint8 code grids or string grids; each cell becomes a
+    ``scale`` x ``scale`` block of pixels.
+    """
+    rgb = color_lut(colors)[_as_codes(stack, colors)]
+    if scale > 1:
+        rgb = rgb.repeat(scale, axis=-3).repeat(scale, axis=-2)
+    return rgb
+
+# ---------- contact sheets ---------------------------------------------------
+def contact_sheet(stack, colors=DEFAULT_COLORS, columns=20, scale=8, gap=2):
+    """Tile a stack of grids into one RGB image, row-major, ``columns`` across.
+
+    Tiles are separated by ``gap`` background pixels.  Built with one reshape
+    and transpose of the padded tile array, however many grids there are.
+    """
+    tiles = stack_to_rgb(stack, colors, scale)
+    if tiles.ndim != 4 or not len(tiles):
+        raise ValueError("Need a non-empty (N, rows, cols) stack of grids.")
+    n, h, w, _ = tiles.shape
+    columns = min(columns, n)
+    rows = -(-n // columns)
+    cells = np.empty((rows * columns, h + gap, w + gap, 3), dtype=np.uint8)
+    cells[:] = BACKGROUND
+    cells[:n, :h, :w] = tiles
+    sheet = cells.reshape(rows, columns, h + gap, w + gap, 3).transpose(0, 2, 1, 3, 4)
+    sheet = sheet.reshape(rows * (h + gap), columns * (w + gap), 3)
+    return sheet[:sheet.shape[0] - gap, :sheet.shape[1] - gap]
+
+
+def save_png(path, image, dpi=100):
+    """Write an RGB image to PNG pixel for pixel through the Agg backend.
+
+    Uses a bare Figure and FigureCanvasAgg, so pyplot (and any GUI backend)
+    is never loaded and nothing is shown.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    h, w = image.shape[:2]
+    fig = Figure(figsize=(w / dpi, h / dpi), dpi=dpi)
+    fig.figimage(image, origin='upper')
+    FigureCanvasAgg(fig).print_png(path)
+
+
+def write_gallery(chunks, colors=DEFAULT_COLORS, prefix="gallery", per_page=1000,
+                  columns=25, scale=8, gap=2):
+    """Write a stream of grid stacks as numbered PNG contact sheets.
+
+    ``chunks`` is any iterable of stacks, e.g. ``engine.iter_chunks``; grids
+    are buffered only until a page is full.  Page k (from 1) holds patterns
+    (k-1)*per_page + 1 to k*per_page, row-major.  Returns the page paths.
+    """
+    paths = []
+    pending = []
+    n_pending = 0
+
+    def flush(stack):
+        path = f"{prefix}_{len(paths) + 1:04d}.png"
+        save_png(path, contact_sheet(stack, colors, columns, scale, gap))
+        paths.append(path)
+
+    for chunk in chunks:
+        pending.append(_as_codes(chunk, colors))
+        n_pending += len(chunk)
+        if n_pending < per_page:
+            continue
+        stack = np.concatenate(pending)
+        for start in range(0, len(stack) - per_page + 1, per_page):
+            flush(stack[start:start + per_page])
+        rest = stack[len(stack) // per_page * per_page:]
+        pending = [rest] if len(rest) else []
+        n_pending = len(rest)
+    if n_pending:
+        flush(np.concatenate(pending))
+    return paths
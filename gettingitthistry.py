@@ -1,22 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from itertools import permutations
-
-def create_empty_grid(rows, cols):
-    return np.full((rows, cols), 'E')
-
-def can_place(grid, row, col, shape):
-    return row + shape[0] <= grid.shape[0] and col + shape[1] <= grid.shape[1]
-
-def place_shape(grid, row, col, shape, color):
-    grid_copy = grid.copy()
-    grid_copy[row:row + shape[0], col:col + shape[1]] = color
-    return grid_copy
+from engine import iter_patterns
+from plotting import pyplot, show
 
 def is_shape_visible(grid, color):
     return color in grid
 
 def visualize_grid(grid, pattern_num):
+    plt = pyplot()
     rgb_grid = np.zeros((grid.shape[0], grid.shape[1], 3))
 
     for i in range(grid.shape[0]):
@@ -46,47 +36,27 @@ def visualize_grid(grid, pattern_num):
 
     ax.set_title(f"Pattern {pattern_num + 1}")
     plt.tight_layout()
-    plt.show()
-
-def shape_orientations(shape):
-    if shape[0] != shape[1]:
-        return [shape, (shape[1], shape[0])]
-    return [shape]
+    show()
 
 def grid_to_string(grid):
     """Convert grid to a single string representation."""
     return ''.join(grid.flatten())
 
-def generate_patterns(grid_size, shapes):
-    rows, cols = grid_size
+def generate_patterns(grid_size, shapes, colors=('R', 'G', 'B')):
+    """Every layout for any number of shapes; shape i is drawn in colors[i]."""
     all_patterns = []  # Stores ALL patterns in order
     seen_patterns = set()  # Checks for duplicates
 
-    shape_orders = permutations([('R', shapes[0]), ('G', shapes[1]), ('B', shapes[2])])
-
-    for shape_order in shape_orders:
-        grids_to_process = [create_empty_grid(rows, cols)]
-
-        for color, shape in shape_order:
-            new_grids = []
-            orientations = shape_orientations(shape)
-
-            for grid in grids_to_process:
-                for oriented_shape in orientations:
-                    for r in range(rows):
-                        for c in range(cols):
-                            if can_place(grid, r, c, oriented_shape):
-                                placed_grid = place_shape(grid, r, c, oriented_shape, color)
-                                new_grids.append(placed_grid)
-
-            grids_to_process = new_grids
+    if len(colors) < len(shapes):
+        raise ValueError(f"Need a color for each of the {len(shapes)} shapes, got {colors}.")
+    shapes_colors = list(zip(shapes, colors))
 
-        for final_grid in grids_to_process:
-            grid_str = grid_to_string(final_grid)
-            is_duplicate = grid_str in seen_patterns
-            seen_patterns.add(grid_str)
-            # Store both the grid and whether it's duplicate
-            all_patterns.append((final_grid, is_duplicate))
+    for final_grid in iter_patterns(grid_size, shapes_colors, share_prefixes=False):
+        grid_str = grid_to_string(final_grid)
+        is_duplicate = grid_str in seen_patterns
+        seen_patterns.add(grid_str)
+        # Store both the grid and whether it's duplicate
+        all_patterns.append((final_grid, is_duplicate))
 
     return all_patterns
 
@@ -0,0 +1,115 @@
+import re
+import numpy as np
+from bitgrid import DEFAULT_COLORS
+from patternstore import write_store
+
+# ---------- legacy text formats ----------------------------------------------
+# Two text layouts exist in the archives:
+#
+#   'pattern'  (sha.save_patterns_to_file)     'nparray'  (npgrid.save_patterns_to_file)
+#       Pattern 1:                                 grid1 = np.array([
+#       ['B' 'B' 'B' ...]                              ['B', 'B', 'B', ...],
+#       ['G' 'G' 'E' ...]                              ['G', 'G', 'E', ...],
+#                                                  ])
+#
+# In both, every cell is a single quoted character and nothing else is
+# quoted, so the cells of the whole file are simply the characters after
+# every opening quote, in order.  The reader below finds them with one NumPy
+# scan per block and reshapes them into grids; no per-row lists are built.
+_PATTERN_HEADER = re.compile(r'^\s*Pattern \d+:\s*$')
+_NPARRAY_HEADER = re.compile(r'^\s*\w+\s*=\s*np\.array\(\[\s*$')
+_QUOTES = (ord("'"), ord('"'))
+_MARKERS = {'pattern': b'Pattern ', 'nparray': b'np.array('}
+
+
+def legacy_info(path):
+    """(format, (rows, cols)) of a legacy text archive, from its first pattern."""
+    fmt = None
+    rows = 0
+    cols = 0
+    with open(path, 'r') as f:
+        for line in f:
+            if fmt is None:
+                if _PATTERN_HEADER.match(line):
+                    fmt = 'pattern'
+                elif _NPARRAY_HEADER.match(line):
+                    fmt = 'nparray'
+                elif line.strip():
+                    raise ValueError(f"Unrecognised pattern format in '{path}': {line.strip()!r}")
+                continue
+            if "'" not in line and '"' not in line:
+                if rows:
+                    break
+                continue
+            width = (line.count("'") + line.count('"')) // 2
+            if cols and width != cols:
+                raise ValueError(f"Ragged rows in the first pattern of '{path}'.")
+            cols = width
+            rows += 1
+    if fmt is None or not rows:
+        raise ValueError(f"No patterns found in '{path}'.")
+    return fmt, (rows, cols)
+
+
+def iter_legacy_chunks(path, colors=DEFAULT_COLORS, block_size=1 << 22):
+    """Stream a legacy text archive as uint8 code stacks, block by block.
+
+    The format and grid shape are auto-detected.  Raises ValueError on a cell
+    outside ``colors`` or if the cell count does not match the number of
+    pattern headers.
+    """
+    fmt, (rows, cols) = legacy_info(path)
+    per_grid = rows * cols
+    marker = _MARKERS[fmt]
+    lut = np.full(256, 255, dtype=np.uint8)
+    for code, color in enumerate(colors):
+        lut[ord(color)] = code
+
+    headers = 0
+    emitted = 0
+    carry = np.empty(0, dtype=np.uint8)
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block += f.readline()   # never split a row across blocks
+            headers += block.count(marker)
+            buf = np.frombuffer(block, dtype=np.uint8)
+            quotes = np.flatnonzero((buf == _QUOTES[0]) | (buf == _QUOTES[1]))
+            cells = lut[buf[quotes[0::2] + 1]]
+            if (cells == 255).any():
+                bad = sorted({chr(b) for b in buf[quotes[0::2] + 1][cells == 255]})
+                raise ValueError(f"Cells {bad} in '{path}' are not in the alphabet {colors}.")
+            if len(carry):
+                cells = np.concatenate([carry, cells])
+            n = len(cells) // per_grid * per_grid
+            if n:
+                yield cells[:n].reshape(-1, rows, cols)
+                emitted += n // per_grid
+            carry = cells[n:]
+    if len(carry) or emitted != headers:
+        raise ValueError(f"'{path}' has {headers} patterns but {emitted * per_grid + len(carry)} "
+                         f"cells; expected {rows}x{cols} cells per pattern.")
+
+
+def read_legacy(path, colors=DEFAULT_COLORS):
+    """Whole legacy archive as one (N, rows, cols) uint8 code stack."""
+    _, (rows, cols) = legacy_info(path)
+    chunks = list(iter_legacy_chunks(path, colors))
+    if not chunks:
+        return np.empty((0, rows, cols), dtype=np.uint8)
+    return np.concatenate(chunks)
+
+
+def convert_to_store(src, dst, colors=DEFAULT_COLORS, packed=False):
+    """Convert a legacy text archive into a binary pattern store; returns count."""
+    _, grid_size = legacy_info(src)
+    return write_store(dst, iter_legacy_chunks(src, colors), grid_size, colors, packed)
+
+
+if __name__ == "__main__":
+    for name in ("patterns.txt", "patterns1.txt", "patterns2.txt"):
+        fmt, grid_size = legacy_info(name)
+        count = convert_to_store(name, name.replace('.txt', '.pat'))
+        print(f"{name}: {fmt} format, {grid_size}, {count} patterns")
@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations
+from counting import canonical_tops, iter_canonical_boards
+from engine import iter_shard
+from placements import placement_table
+
+# ---------- sharding ---------------------------------------------------------
+def make_shards(grid_size, shapes, orders=None):
+    """One (order, first-shape placement index) pair per unit of work."""
+    if orders is None:
+        orders = permutations(range(len(shapes)))
+    shards = []
+    for order in orders:
+        first_shape, _ = shapes[order[0]]
+        n_first = len(placement_table(grid_size, first_shape).placements)
+        shards.extend((tuple(order), first) for first in range(n_first))
+    return shards
+
+def run_shard(grid_size, shapes, order, first, require_visible=False):
+    """Enumerate one shard and dedupe it locally: (total, set of boards)."""
+    total = 0
+    seen = set()
+    for board in iter_shard(grid_size, shapes, order, first, require_visible):
+        total += 1
+        seen.add(board)
+    return total, seen
+
+def _run_shard(args):
+    return run_shard(*args)
+
+# ---------- parallel driver --------------------------------------------------
+def generate_unique_parallel(grid_size, shapes, require_visible=False, orders=None,
+                             workers=None, chunksize=None):
+    """Enumerate every layout on a process pool and merge the local dedupes.
+
+    Returns ``(total layouts, set of distinct boards)``.  Each worker dedupes
+    its own shard; the parent folds the shard sets into one global set as they
+    arrive, so only one shard result is pending in memory per worker.
+    """
+    shards = make_shards(grid_size, shapes, orders)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(shards) // (workers * 4))
+    jobs = [(grid_size, shapes, order, first, require_visible) for order, first in shards]
+
+    total = 0
+    unique = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard_total, shard_seen in pool.map(_run_shard, jobs, chunksize=chunksize):
+            total += shard_total
+            unique |= shard_seen
+    return total, unique
+
+def _run_canonical_shard(args):
+    grid_size, shapes, top, require_visible = args
+    return sum(1 for _ in iter_canonical_boards(grid_size, shapes, require_visible, top))
+
+def count_unique_orderly_parallel(grid_size, shapes, require_visible=False,
+                                  workers=None, chunksize=None):
+    """Number of distinct layouts from orderly generation on a process pool.
+
+    Shards are the ``counting.canonical_tops``; each emits only canonical
+    layouts and no two shards share one, so the parent just adds up counts.
+    Needs one distinct color per shape.
+    """
+    tops = canonical_tops(grid_size, shapes, require_visible)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(tops) // (workers * 4))
+    jobs = [(grid_size, shapes, top, require_visible) for top in tops]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(_run_canonical_shard, jobs, chunksize=chunksize))
+
+# ---------- driver -----------------------------------------------------------
+def main():
+    grid_size = (4, 12)
+    shapes = [((3, 3), 'R'),   # red square
+              ((2, 5), 'G'),   # green rectangle
+              ((1, 9), 'B'),   # blue rectangle
+              ((2, 2), 'Y')]   # yellow square
+
+    total, unique = generate_unique_parallel(grid_size, shapes)
+    print(f"Shapes: {len(shapes)}  grid: {grid_size}  workers: {os.cpu_count()}")
+    print(f"Total patterns generated: {total}")
+    print(f"Total unique patterns : {len(unique)}")
+    print(f"Orderly generation    : {count_unique_orderly_parallel(grid_size, shapes)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import os
+import struct
+import zlib
+import numpy as np
+from bitgrid import bits_per_cell, pack_codes, unpack_codes, decode_grid
+
+# ---------- file layout ------------------------------------------------------
+# A pattern store is a fixed 64-byte header followed by one fixed-size record
+# per pattern, back to back:
+#
+#   magic     8s   b'PATSTORE'
+#   version   u16
+#   rows      u16
+#   cols      u16
+#   n_colors  u8   size of the colour alphabet (code 0 = empty)
+#   bits      u8   bits per cell: 8 = one uint8 per cell, 1/2/4 = bit-packed
+#   count     u64  number of records
+#   crc32     u32  CRC-32 of every record byte, in order
+#   alphabet  16s  one ASCII character per colour code
+#
+# Records are uint8 code grids (see bitgrid.py), optionally bit-packed with
+# bitgrid.pack_codes, so pattern i starts at HEADER_SIZE + i * record_size.
+MAGIC = b'PATSTORE'
+VERSION = 1
+HEADER_FORMAT = '<8sHHHBBQI16s'
+HEADER_SIZE = 64
+
+
+def _record_size(header):
+    cells = header['rows'] * header['cols']
+    return (cells * header['bits'] + 7) // 8
+
+
+def _pack_header(header):
+    alphabet = ''.join(header['colors']).encode('ascii')
+    raw = struct.pack(HEADER_FORMAT, MAGIC, VERSION, header['rows'], header['cols'],
+                      len(header['colors']), header['bits'], header['count'],
+                      header['crc32'], alphabet)
+    return raw.ljust(HEADER_SIZE, b'\0')
+
+
+def _unpack_header(raw):
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("File is too short to be a pattern store.")
+    magic, version, rows, cols, n_colors, bits, count, crc, alphabet = struct.unpack_from(
+        HEADER_FORMAT, raw)
+    if magic != MAGIC:
+        raise ValueError("Not a pattern store (bad magic).")
+    if version != VERSION:
+        raise ValueError(f"Unsupported pattern store version {version}.")
+    colors = tuple(alphabet[:n_colors].decode('ascii'))
+    return {'rows': rows, 'cols': cols, 'colors': colors, 'bits': bits,
+            'count': count, 'crc32': crc}
+
+
+def new_header(grid_size, colors, packed=False):
+    """Header for an empty store of ``grid_size`` grids over ``colors``."""
+    colors = tuple(colors)
+    if len(colors) > 16 or any(len(c) != 1 for c in colors):
+        raise ValueError(f"Alphabet must be at most 16 single characters, got {colors}.")
+    return {'rows': grid_size[0], 'cols': grid_size[1], 'colors': colors,
+            'bits': bits_per_cell(len(colors)) if packed else 8,
+            'count': 0, 'crc32': 0}
+
+
+def read_header(path):
+    """Header of a store as a dict (rows, cols, colors, bits, count, crc32)."""
+    with open(path, 'rb') as f:
+        return _unpack_header(f.read(HEADER_SIZE))
+
+# ---------- writing ----------------------------------------------------------
+def _write_records(f, header, stack):
+    stack = np.asarray(stack, dtype=np.uint8)
+    if stack.shape[1:] != (header['rows'], header['cols']):
+        raise ValueError(f"Grids of shape {stack.shape[1:]} do not match the store "
+                         f"({header['rows']}, {header['cols']}).")
+    data = pack_codes(stack, header['bits']).tobytes()
+    f.write(data)
+    header['count'] += len(stack)
+    header['crc32'] = zlib.crc32(data, header['crc32'])
+
+
+def write_store(path, chunks, grid_size, colors, packed=False):
+    """Write a new store from an iterable of uint8 code stacks; returns count.
+
+    ``chunks`` can be a stream such as ``engine.iter_chunks``; each chunk is
+    written as it arrives and the header is finalized at the end.
+    """
+    header = new_header(grid_size, colors, packed)
+    with open(path, 'wb') as f:
+        f.write(_pack_header(header))
+        for chunk in chunks:
+            _write_records(f, header, chunk)
+        f.seek(0)
+        f.write(_pack_header(header))
+    return header['count']
+
+
+def append_patterns(path, stack):
+    """Append an (N, rows, cols) code stack to an existing store."""
+    with open(path, 'r+b') as f:
+        header = _unpack_header(f.read(HEADER_SIZE))
+        f.seek(HEADER_SIZE + header['count'] * _record_size(header))
+        f.truncate()
+        _write_records(f, header, stack)
+        f.seek(0)
+        f.write(_pack_header(header))
+    return header['count']
+
+
+def truncate_store(path, count, block=1 << 20):
+    """Cut a store back to its first ``count`` records, recomputing the CRC."""
+    with open(path, 'r+b') as f:
+        header = _unpack_header(f.read(HEADER_SIZE))
+        if count > header['count']:
+            raise ValueError(f"Cannot truncate a store of {header['count']} to {count}.")
+        keep = count * _record_size(header)
+        crc = 0
+        done = 0
+        while done < keep:
+            data = f.read(min(block, keep - done))
+            crc = zlib.crc32(data, crc)
+            done += len(data)
+        f.truncate(HEADER_SIZE + keep)
+        header['count'] = count
+        header['crc32'] = crc
+        f.seek(0)
+        f.write(_pack_header(header))
+    return count
+
+# ---------- reading ----------------------------------------------------------
+def read_patterns(path, start=0, stop=None):
+    """Patterns ``start:stop`` as a uint8 code stack, reading only those."""
+    with open(path, 'rb') as f:
+        header = _unpack_header(f.read(HEADER_SIZE))
+        count = header['count']
+        stop = count if stop is None else min(stop, count)
+        start = min(max(start, 0), stop)
+        size = _record_size(header)
+        f.seek(HEADER_SIZE + start * size)
+        data = np.frombuffer(f.read((stop - start) * size), dtype=np.uint8)
+    return unpack_codes(data.reshape(stop - start, size),
+                        (header['rows'], header['cols']), header['bits'])
+
+
+def read_pattern(path, index):
+    """Pattern ``index`` as a uint8 code grid (random access)."""
+    count = read_header(path)['count']
+    if not 0 <= index < count:
+        raise IndexError(f"Pattern {index} out of range for a store of {count}.")
+    return read_patterns(path, index, index + 1)[0]
+
+
+def read_pattern_strings(path, index):
+    """Pattern ``index`` decoded to a string grid."""
+    return decode_grid(read_pattern(path, index), read_header(path)['colors'])
+
+
+def verify_store(path, block=1 << 20):
+    """True if the file size and CRC-32 match the header."""
+    with open(path, 'rb') as f:
+        header = _unpack_header(f.read(HEADER_SIZE))
+        expected = header['count'] * _record_size(header)
+        crc = 0
+        seen = 0
+        while True:
+            data = f.read(min(block, expected - seen))
+            if not data:
+                break
+            crc = zlib.crc32(data, crc)
+            seen += len(data)
+    return seen == expected and crc == header['crc32'] and \
+        os.path.getsize(path) == HEADER_SIZE + expected
+
+# ---------- memory-mapped access ---------------------------------------------
+def open_store(path):
+    """Memory-map a store: returns ``(header, records)`` without reading data.
+
+    For an unpacked store (bits == 8) ``records`` is a read-only
+    ``(count, rows, cols)`` uint8 view straight onto the file, so
+    ``records[1_000_000]`` touches only that pattern's bytes and slices are
+    zero-copy.  For a bit-packed store ``records`` is the ``(count, nbytes)``
+    view of the packed rows; expand just the part you need with
+    ``unpack_records``.
+    """
+    header = read_header(path)
+    count, size = header['count'], _record_size(header)
+    if header['bits'] == 8:
+        shape = (count, header['rows'], header['cols'])
+    else:
+        shape = (count, size)
+    if count == 0:
+        return header, np.empty(shape, dtype=np.uint8)
+    records = np.memmap(path, dtype=np.uint8, mode='r', offset=HEADER_SIZE, shape=shape)
+    return header, records
+
+
+def unpack_records(header, records):
+    """Code stack for a slice of ``open_store`` records, packed or not."""
+    if header['bits'] == 8:
+        return records
+    return unpack_codes(records, (header['rows'], header['cols']), header['bits'])
+
+
+def is_store(path):
+    """True if ``path`` starts with the pattern-store magic."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
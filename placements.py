@@ -0,0 +1,88 @@
+import os
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+from bitgrid import fits, rect_mask
+
+# ---------- placement tables -------------------------------------------------
+# Every valid (orientation, row, col) of a shape on a grid, computed once per
+# (grid_size, shape) and shared by every layer of every stacking order.
+#   placements  tuple of (oriented_shape, row, col), (orientation, row, col) order
+#   bitmasks    tuple of int bitboard masks (see bitgrid.py), one per placement
+#   cell_masks  read-only bool array (P, rows, cols), True where a placement lands
+PlacementTable = namedtuple('PlacementTable',
+                            'grid_size shape placements bitmasks cell_masks')
+
+CACHE_ENV = 'PLACEMENT_CACHE_DIR'
+
+
+def shape_orientations(shape):
+    return [shape, (shape[1], shape[0])] if shape[0] != shape[1] else [shape]
+
+
+def _build(grid_size, shape):
+    rows, cols = grid_size
+    placements = tuple((oriented, r, c)
+                       for oriented in shape_orientations(shape)
+                       for r in range(rows)
+                       for c in range(cols)
+                       if fits(grid_size, r, c, oriented))
+    cell_masks = np.zeros((len(placements), rows, cols), dtype=bool)
+    for p, (oriented, r, c) in enumerate(placements):
+        cell_masks[p, r:r + oriented[0], c:c + oriented[1]] = True
+    return placements, cell_masks
+
+
+def _cache_path(cache_dir, grid_size, shape):
+    rows, cols = grid_size
+    return os.path.join(cache_dir, f"placements_{rows}x{cols}_{shape[0]}x{shape[1]}.npz")
+
+
+def _load(path):
+    with np.load(path) as data:
+        spec = data['placements']
+        rows, cols = (int(v) for v in data['grid_size'])
+        cells = np.unpackbits(data['cell_masks'], axis=1, count=rows * cols)
+    placements = tuple(((int(h), int(w)), int(r), int(c)) for h, w, r, c in spec)
+    return placements, cells.reshape(len(placements), rows, cols).astype(bool)
+
+
+def _save(path, grid_size, placements, cell_masks):
+    spec = np.array([(o[0], o[1], r, c) for o, r, c in placements],
+                    dtype=np.int16).reshape(-1, 4)
+    packed = np.packbits(cell_masks.reshape(len(placements), -1), axis=1)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp.npz'
+    np.savez(tmp, grid_size=np.array(grid_size), placements=spec, cell_masks=packed)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=256)
+def _table(grid_size, shape, cache_dir):
+    path = _cache_path(cache_dir, grid_size, shape) if cache_dir else None
+    if path and os.path.exists(path):
+        placements, cell_masks = _load(path)
+    else:
+        placements, cell_masks = _build(grid_size, shape)
+        if path:
+            _save(path, grid_size, placements, cell_masks)
+    cell_masks.flags.writeable = False
+    bitmasks = tuple(rect_mask(grid_size, r, c, oriented)
+                     for oriented, r, c in placements)
+    return PlacementTable(grid_size, shape, placements, bitmasks, cell_masks)
+
+
+def placement_table(grid_size, shape, cache_dir=None):
+    """Placement table for a shape on a grid, cached in memory (LRU).
+
+    With ``cache_dir`` (or the PLACEMENT_CACHE_DIR environment variable) the
+    table is also persisted as a small .npz file and reloaded on later runs.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_ENV)
+    return _table(tuple(grid_size), tuple(shape), cache_dir)
+
+
+def clear_cache():
+    """Drop every in-memory placement table."""
+    _table.cache_clear()
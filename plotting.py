@@ -0,0 +1,31 @@
+import os
+
+# ---------- lazy matplotlib --------------------------------------------------
+# Enumeration, counting and dedupe only need NumPy; matplotlib is imported the
+# first time something is drawn.  Set PATTERNS_HEADLESS=1 for batch jobs: the
+# non-interactive Agg backend is selected and ``show`` closes figures instead
+# of opening a window and blocking.
+HEADLESS_ENV = 'PATTERNS_HEADLESS'
+
+
+def headless():
+    """True if PATTERNS_HEADLESS is set to anything but '' or '0'."""
+    return os.environ.get(HEADLESS_ENV, '') not in ('', '0')
+
+
+def pyplot():
+    """``matplotlib.pyplot``, imported on first use."""
+    import matplotlib
+    if headless():
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def show():
+    """``plt.show()``, or just free the figures in headless mode."""
+    plt = pyplot()
+    if headless():
+        plt.close('all')
+    else:
+        plt.show()
@@ -0,0 +1,144 @@
+import os
+from collections import namedtuple
+from itertools import permutations
+import numpy as np
+from bitgrid import board_to_codes
+from engine import iter_boards
+from placements import placement_table
+
+# ---------- provenance index -------------------------------------------------
+# For every distinct layout, every way the search produces it.  A derivation
+# is one stacking order plus one placement per layer, stored as a row of
+# small integers:
+#
+#   [order id, p_0, p_1, ..., p_{n-1}]
+#
+# where ``order id`` indexes ``orders`` and p_k indexes the placement table of
+# the shape placed k-th (see placements.py), which gives its orientation, row
+# and column.  Rows are grouped by layout CSR-style: the derivations of layout
+# i are ``derivations[offsets[i]:offsets[i + 1]]``, so "how many ways produce
+# layout i" is one subtraction.  Layout ids follow first appearance in the
+# order-by-order enumeration, the numbering of duplicatechecker.py.
+#   orders       tuple of stacking orders (tuples of shape indices)
+#   layouts      (U, rows, cols) uint8 code grids, one per layout id
+#   offsets      (U + 1,) int64
+#   derivations  (M, n + 1) uint16 (uint32 if an index does not fit)
+ProvenanceIndex = namedtuple('ProvenanceIndex',
+                             'grid_size shapes orders layouts offsets derivations')
+
+
+def iter_derivations(grid_size, shapes, require_visible=False):
+    """Yield ``(board, order id, placement indices)`` for every layout produced.
+
+    Walks every stacking order, order by order, in the same sequence as
+    ``engine.iter_boards(..., share_prefixes=False)``.
+    """
+    order_ids = {order: i for i, order in enumerate(permutations(range(len(shapes))))}
+    for board, path in iter_boards(grid_size, shapes, require_visible,
+                                   share_prefixes=False, with_placements=True):
+        order, placed = zip(*path)
+        yield board, order_ids[order], placed
+
+
+def build_provenance(grid_size, shapes, require_visible=False):
+    """ProvenanceIndex of every layout over every stacking order."""
+    orders = tuple(permutations(range(len(shapes))))
+    ids = {}            # board -> layout id
+    layouts = []
+    owner = []          # layout id of each derivation, in enumeration order
+    rows = []
+    for board, order_id, placed in iter_derivations(grid_size, shapes, require_visible):
+        layout = ids.get(board)
+        if layout is None:
+            layout = ids[board] = len(layouts)
+            layouts.append(board_to_codes(board, grid_size))
+        owner.append(layout)
+        rows.append((order_id,) + placed)
+
+    largest = max(len(orders), *(len(placement_table(grid_size, s).placements)
+                                 for s, _ in shapes))
+    dtype = np.uint16 if largest <= np.iinfo(np.uint16).max else np.uint32
+    owner = np.array(owner, dtype=np.int64)
+    order = np.argsort(owner, kind='stable')    # group rows by layout, keep order
+    derivations = np.array(rows, dtype=dtype).reshape(-1, len(shapes) + 1)[order]
+    offsets = np.zeros(len(layouts) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owner, minlength=len(layouts)), out=offsets[1:])
+    rows_, cols_ = grid_size
+    stack = np.array(layouts, dtype=np.uint8).reshape(-1, rows_, cols_)
+    return ProvenanceIndex(tuple(grid_size), tuple(shapes), orders, stack, offsets,
+                           derivations)
+
+# ---------- queries ----------------------------------------------------------
+def ways(index, layout):
+    """Number of (order, placements) derivations that produce a layout id."""
+    return int(index.offsets[layout + 1] - index.offsets[layout])
+
+
+def ways_per_layout(index):
+    """Derivation count of every layout id at once."""
+    return np.diff(index.offsets)
+
+
+def layout_id(index, grid):
+    """Id of a uint8 code grid, or None if the search never produces it."""
+    hits = np.flatnonzero((index.layouts == np.asarray(grid)).all(axis=(1, 2)))
+    return int(hits[0]) if len(hits) else None
+
+
+def derivations_of(index, layout):
+    """Decoded derivations of a layout id.
+
+    Each is ``(order, [(shape index, oriented shape, row, col), ...])``, with
+    the placements listed bottom to top.
+    """
+    tables = [placement_table(index.grid_size, shape) for shape, _ in index.shapes]
+    decoded = []
+    for row in index.derivations[index.offsets[layout]:index.offsets[layout + 1]].tolist():
+        order = index.orders[row[0]]
+        decoded.append((order, [(s, *tables[s].placements[p])
+                                for s, p in zip(order, row[1:])]))
+    return decoded
+
+# ---------- persistence ------------------------------------------------------
+def save_provenance(path, index):
+    """Write an index to a compressed .npz file."""
+    spec = np.array([(h, w) for (h, w), _ in index.shapes], dtype=np.int64).reshape(-1, 2)
+    colors = np.array([c for _, c in index.shapes])
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    np.savez_compressed(path, grid_size=np.array(index.grid_size), shapes=spec,
+                        colors=colors, orders=np.array(index.orders, dtype=np.int64),
+                        layouts=index.layouts, offsets=index.offsets,
+                        derivations=index.derivations)
+
+
+def load_provenance(path):
+    """Read an index written by ``save_provenance``."""
+    with np.load(path) as data:
+        shapes = tuple(((int(h), int(w)), str(c))
+                       for (h, w), c in zip(data['shapes'], data['colors']))
+        return ProvenanceIndex(tuple(int(v) for v in data['grid_size']), shapes,
+                               tuple(tuple(int(v) for v in o) for o in data['orders']),
+                               data['layouts'], data['offsets'], data['derivations'])
+
+# ---------- driver -----------------------------------------------------------
+def main():
+    grid_size = (3, 9)
+    shapes = [((3, 3), 'R'),   # red square
+              ((2, 5), 'G'),   # green rectangle
+              ((1, 9), 'B')]   # blue rectangle
+
+    index = build_provenance(grid_size, shapes)
+    counts = ways_per_layout(index)
+    print(f"Layouts: {len(index.layouts)}  derivations: {len(index.derivations)} "
+          f"({index.derivations.nbytes} bytes)")
+    for n, k in zip(*np.unique(counts, return_counts=True)):
+        print(f"  {k} layouts produced {n} way(s)")
+
+    busiest = int(counts.argmax())
+    print(f"\nLayout {busiest + 1} is produced {ways(index, busiest)} ways:")
+    for order, placed in derivations_of(index, busiest):
+        steps = ", ".join(f"{shapes[s][1]}{oriented}@({r},{c})" for s, oriented, r, c in placed)
+        print(f"  order {order}: {steps}")
+
+if __name__ == "__main__":
+    main()
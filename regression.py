@@ -0,0 +1,164 @@
+import argparse
+import os
+import sys
+from bisect import bisect_left
+import numpy as np
+from bitgrid import color_alphabet
+from engine import iter_chunks
+from fingerprint import fingerprint_stack
+from legacyformats import iter_legacy_chunks
+from patternstore import is_store, open_store, unpack_records
+
+# ---------- golden cases -----------------------------------------------------
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Each case regenerates a stored archive: grid size, (shape, color) pairs,
+# whether every shape must stay visible, and the archive to compare with.
+# Archives are generated order by order (share_prefixes=False), matching how
+# they were originally written.
+CASES = {
+    'bruteforced': {'grid_size': (3, 9),
+                    'shapes': [((3, 3), 'R'), ((2, 5), 'G'), ((1, 9), 'B')],
+                    'require_visible': False,
+                    'archive': os.path.join(HERE, 'bruteforced_reference.pat')},
+    'patterns': {'grid_size': (3, 8),
+                 'shapes': [((3, 3), 'R'), ((2, 4), 'G'), ((1, 8), 'B')],
+                 'require_visible': False,
+                 'archive': os.path.join(HERE, 'patterns.txt')},
+    'patterns1': {'grid_size': (3, 9),
+                  'shapes': [((3, 3), 'R'), ((2, 5), 'G'), ((1, 9), 'B')],
+                  'require_visible': False,
+                  'archive': os.path.join(HERE, 'patterns1.txt')},
+    'patterns2': {'grid_size': (3, 9),
+                  'shapes': [((3, 3), 'R'), ((2, 5), 'G'), ((1, 9), 'B')],
+                  'require_visible': False,
+                  'archive': os.path.join(HERE, 'patterns2.txt')},
+    # two shapes of one colour: the second must not erase the first
+    'shared_colors': {'grid_size': (3, 9),
+                      'shapes': [((3, 3), 'R'), ((2, 5), 'R'), ((1, 9), 'B')],
+                      'require_visible': False,
+                      'archive': os.path.join(HERE, 'shared_colors_reference.pat')},
+}
+
+# ---------- streaming fingerprints -------------------------------------------
+def archive_chunks(path, colors, chunk_size=65536):
+    """Stream an archive (pattern store or legacy text) in ``colors`` codes."""
+    if is_store(path):
+        header, records = open_store(path)
+        source = (unpack_records(header, records[i:i + chunk_size])
+                  for i in range(0, len(records), chunk_size))
+        archive_colors = header['colors']
+    else:
+        source = iter_legacy_chunks(path, colors)   # read straight into our codes
+        archive_colors = None
+    lut = None
+    if archive_colors is not None and tuple(archive_colors) != tuple(colors):
+        missing = set(archive_colors) - set(colors)
+        if missing:
+            raise ValueError(f"Archive colors {sorted(missing)} are not used by the case.")
+        lut = np.array([colors.index(c) for c in archive_colors], dtype=np.uint8)
+    for chunk in source:
+        yield chunk if lut is None else lut[chunk]
+
+
+def stream_fingerprints(chunks):
+    """One uint64 array with the fingerprint of every grid, in order."""
+    parts = [fingerprint_stack(chunk) for chunk in chunks]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.uint64)
+
+# ---------- comparison -------------------------------------------------------
+def _in_order(positions):
+    """Indices of a longest increasing subsequence of ``positions``.
+
+    Patience sorting with back-pointers, O(n log n).
+    """
+    tails = []          # tails[k]: index ending the best run of length k + 1
+    tail_values = []
+    previous = [-1] * len(positions)
+    for i, p in enumerate(positions):
+        k = bisect_left(tail_values, p)
+        previous[i] = tails[k - 1] if k else -1
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(p)
+        else:
+            tails[k] = i
+            tail_values[k] = p
+    keep = set()
+    i = tails[-1] if tails else -1
+    while i != -1:
+        keep.add(i)
+        i = previous[i]
+    return keep
+
+
+def compare_fingerprints(generated, archived):
+    """Match two fingerprint sequences in O(n log n).
+
+    Equal fingerprints are paired first-come first-served.  Returns a dict
+    with ``missing`` (archive indices never generated), ``extra`` (generated
+    indices not in the archive) and ``reordered`` ((generated, archive) index
+    pairs that match but fall outside the longest run of matches already in
+    archive order).  A single pattern moved elsewhere is the only one
+    reported, and missing or extra patterns do not mark anything reordered.
+    """
+    positions = {}
+    for i, fp in enumerate(archived.tolist()):
+        positions.setdefault(fp, []).append(i)
+    cursor = {}
+    extra = []
+    matched = []        # (generated index, archive index)
+    for i, fp in enumerate(generated.tolist()):
+        slots = positions.get(fp)
+        k = cursor.get(fp, 0)
+        if slots is None or k == len(slots):
+            extra.append(i)
+            continue
+        cursor[fp] = k + 1
+        matched.append((i, slots[k]))
+    in_order = _in_order([j for _, j in matched])
+    reordered = [pair for n, pair in enumerate(matched) if n not in in_order]
+    missing = [i for fp, slots in positions.items() for i in slots[cursor.get(fp, 0):]]
+    missing.sort()
+    return {'missing': missing, 'extra': extra, 'reordered': reordered}
+
+
+def run_case(name, case, limit=10):
+    """Regenerate one case and compare it with its archive; True if identical."""
+    colors = color_alphabet(case['shapes'])
+    generated = stream_fingerprints(iter_chunks(case['grid_size'], case['shapes'],
+                                                require_visible=case['require_visible'],
+                                                share_prefixes=False))
+    archived = stream_fingerprints(archive_chunks(case['archive'], colors))
+    report = compare_fingerprints(generated, archived)
+
+    ok = not any(report.values())
+    status = "ok" if ok else "MISMATCH"
+    print(f"{name}: {len(generated)} generated, {len(archived)} archived -> {status}")
+    if not ok:
+        print(f"  missing   {len(report['missing'])}  (archive patterns never generated)")
+        print(f"  extra     {len(report['extra'])}  (generated patterns not in the archive)")
+        print(f"  reordered {len(report['reordered'])}")
+        for i in report['missing'][:limit]:
+            print(f"    missing   archive pattern {i + 1}")
+        for i in report['extra'][:limit]:
+            print(f"    extra     generated pattern {i + 1}")
+        for i, j in report['reordered'][:limit]:
+            print(f"    reordered generated pattern {i + 1} is archive pattern {j + 1}")
+    return ok
+
+# ---------- driver -----------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare generator output with stored archives.")
+    parser.add_argument('cases', nargs='*', help=f"cases to run (default: all of {', '.join(CASES)})")
+    args = parser.parse_args(argv)
+
+    names = args.cases or list(CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    results = [run_case(name, CASES[name]) for name in names]
+    return 0 if all(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
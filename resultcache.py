@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+from collections import namedtuple
+from bitgrid import color_alphabet
+from engine import ENGINE_VERSION, iter_chunks
+from fingerprint import dedupe_stack
+from patternstore import open_store, verify_store, write_store
+
+# ---------- cache layout -----------------------------------------------------
+# One entry per configuration, named by the SHA-256 of its canonical JSON
+# description (grid size, shapes, colours, options, engine version):
+#
+#   <key>.pat    the pattern set, as a binary pattern store (patternstore.py)
+#   <key>.json   the configuration and its counts
+#
+# A hit touches the .json file, so its mtime is the entry's last use; when the
+# directory grows past ``max_bytes`` the least recently used entries go first.
+CACHE_ENV = 'RESULT_CACHE_DIR'
+DEFAULT_CACHE_DIR = '.result_cache'
+DEFAULT_MAX_BYTES = 1 << 30
+
+CachedResult = namedtuple('CachedResult', 'key path counts colors patterns')
+
+
+def cache_dir_for(cache_dir=None):
+    return cache_dir or os.environ.get(CACHE_ENV) or DEFAULT_CACHE_DIR
+
+
+def describe(grid_size, shapes, require_visible=False, unique=True, exact=True,
+             share_prefixes=True):
+    """Canonical description of a run: everything that changes its output."""
+    return {'grid_size': [int(v) for v in grid_size],
+            'shapes': [[[int(v) for v in shape], color] for shape, color in shapes],
+            'colors': list(color_alphabet(shapes)),
+            'require_visible': bool(require_visible),
+            'unique': bool(unique),
+            'exact': bool(exact),
+            'share_prefixes': bool(share_prefixes),
+            'engine_version': ENGINE_VERSION}
+
+
+def cache_key(config):
+    """SHA-256 hex digest of a ``describe`` dict, independent of key order."""
+    text = json.dumps(config, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _paths(cache_dir, key):
+    base = os.path.join(cache_dir, key)
+    return base + '.pat', base + '.json'
+
+# ---------- lookup and storage -----------------------------------------------
+def lookup(key, cache_dir=None, verify=False):
+    """CachedResult for ``key``, or None on a miss.
+
+    The patterns are memory-mapped, not read.  With ``verify`` the store's
+    checksum is checked first and a corrupt entry counts as a miss.
+    """
+    cache_dir = cache_dir_for(cache_dir)
+    store, meta = _paths(cache_dir, key)
+    try:
+        with open(meta) as f:
+            info = json.load(f)
+        if verify and not verify_store(store):
+            return None
+        header, records = open_store(store)
+    except (OSError, ValueError):
+        return None
+    os.utime(meta)
+    return CachedResult(key, store, info['counts'], header['colors'], records)
+
+
+def entries(cache_dir=None):
+    """(last_used, size, key) for every complete entry, oldest first."""
+    cache_dir = cache_dir_for(cache_dir)
+    if not os.path.isdir(cache_dir):
+        return []
+    found = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith('.json'):
+            continue
+        key = name[:-5]
+        store, meta = _paths(cache_dir, key)
+        try:
+            found.append((os.path.getmtime(meta),
+                          os.path.getsize(meta) + os.path.getsize(store), key))
+        except OSError:
+            continue
+    found.sort()
+    return found
+
+
+def evict(cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, keep=()):
+    """Drop least recently used entries until the cache fits; returns their keys."""
+    cache_dir = cache_dir_for(cache_dir)
+    found = entries(cache_dir)
+    total = sum(size for _, size, _ in found)
+    dropped = []
+    for _, size, key in found:
+        if total <= max_bytes:
+            break
+        if key in keep:
+            continue
+        for path in reversed(_paths(cache_dir, key)):   # meta first: no half entries
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        total -= size
+        dropped.append(key)
+    return dropped
+
+
+def store(key, config, counts, chunks, grid_size, colors, cache_dir=None,
+          max_bytes=DEFAULT_MAX_BYTES):
+    """Write an entry from a stream of code stacks and evict to ``max_bytes``.
+
+    ``counts`` is filled in while ``chunks`` is consumed, so it may be updated
+    by the generator itself.  Both files are written under temporary names and
+    renamed, so readers never see a half-written entry.
+    """
+    cache_dir = cache_dir_for(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    path, meta = _paths(cache_dir, key)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    write_store(tmp, chunks, grid_size, colors)
+    os.replace(tmp, path)
+    tmp = f"{meta}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump({'config': config, 'counts': counts}, f, indent=1, sort_keys=True)
+    os.replace(tmp, meta)
+    evict(cache_dir, max_bytes, keep=(key,))
+    return lookup(key, cache_dir)
+
+# ---------- cached enumeration -----------------------------------------------
+def _unique_chunks(chunks, counts, exact):
+    seen = {}
+    for chunk in chunks:
+        start = counts['total']
+        counts['total'] += len(chunk)
+        dups = dedupe_stack(chunk, seen, start, exact)
+        counts['duplicates'] += len(dups)
+        if dups:
+            keep = sorted(set(range(len(chunk))) - {i - start for i, _ in dups})
+            chunk = chunk[keep]
+        counts['unique'] += len(chunk)
+        yield chunk
+
+
+def _all_chunks(chunks, counts):
+    for chunk in chunks:
+        counts['total'] += len(chunk)
+        yield chunk
+
+
+def cached_patterns(grid_size, shapes, require_visible=False, unique=True, exact=True,
+                    share_prefixes=True, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES,
+                    refresh=False):
+    """Pattern set and counts for a configuration, enumerating only on a miss.
+
+    Returns a CachedResult whose ``patterns`` is a memory-mapped uint8 code
+    stack: the distinct layouts in first-seen order when ``unique``, every
+    layout otherwise.  ``counts`` holds the total number of layouts generated
+    and, when ``unique``, the unique and duplicate counts.  ``refresh``
+    recomputes the entry even if it is cached.
+    """
+    config = describe(grid_size, shapes, require_visible, unique, exact, share_prefixes)
+    key = cache_key(config)
+    if not refresh:
+        hit = lookup(key, cache_dir)
+        if hit is not None:
+            return hit
+
+    colors = color_alphabet(shapes)
+    chunks = iter_chunks(grid_size, shapes, require_visible=require_visible,
+                         share_prefixes=share_prefixes)
+    if unique:
+        counts = {'total': 0, 'unique': 0, 'duplicates': 0}
+        chunks = _unique_chunks(chunks, counts, exact)
+    else:
+        counts = {'total': 0}
+        chunks = _all_chunks(chunks, counts)
+    return store(key, config, counts, chunks, grid_size, colors, cache_dir, max_bytes)
+
+# ---------- driver -----------------------------------------------------------
+def main():
+    grid_size = (3, 9)
+    shapes = [((3, 3), 'R'), ((2, 5), 'G'), ((1, 9), 'B')]
+
+    for require_visible in (False, True):
+        config = describe(grid_size, shapes, require_visible)
+        hit = lookup(cache_key(config))
+        result = hit or cached_patterns(grid_size, shapes, require_visible)
+        counts = result.counts
+        print(f"require_visible={require_visible}: {'cache hit' if hit else 'computed'} "
+              f"({result.key[:12]})")
+        print(f"  Total patterns generated: {counts['total']}")
+        print(f"  Total unique patterns : {counts['unique']}")
+    print(f"Cache: {len(entries())} entries in '{cache_dir_for()}'")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from itertools import permutations, product
+from bitgrid import encode_grid
+from fingerprint import relabel_colors
+from plotting import pyplot, show
 
 def create_empty_grid(rows, cols):
     return np.full((rows, cols), 'E')
@@ -16,15 +18,21 @@ def place_shape(grid, r, c, shape, color):
 def shape_orientations(shape):
     return [shape, (shape[1], shape[0])] if shape[0] != shape[1] else [shape]
 
-def normalize_pattern(grid):
-    norm = grid.copy()
-    norm[norm=='R'] = 'X'
-    norm[norm=='G'] = 'Y'
-    norm[norm=='B'] = 'Z'
-    return ''.join(norm.flatten())
+def normalize_pattern(grid, relabel=False):
+    """Dedupe key of a layout.
+
+    Renaming the colours one-to-one (R->X, ...) merged nothing, so the plain
+    cells are the key.  With ``relabel`` colours are renumbered by order of
+    first appearance (fingerprint.relabel_colors), so layouts that differ only
+    by which colour is which share a key.
+    """
+    if relabel:
+        return relabel_colors(encode_grid(grid)[None]).tobytes()
+    return ''.join(grid.ravel())
 
 def visualize_grid(grid, idx, title=""):
     """Visualize the grid with red, green, and blue shapes"""
+    plt = pyplot()
     # Create RGB grid with proper color mapping
     rgb_grid = np.zeros((grid.shape[0], grid.shape[1], 3))
     
@@ -64,7 +72,7 @@ def visualize_grid(grid, idx, title=""):
 
     ax.set_title(f"{title} Pattern {idx}")
     plt.tight_layout()
-    plt.show()
+    show()
 
 def generate_all_patterns(grid_size, shapes):
     """Generate every placement of three shapes (with duplicates)."""
@@ -90,10 +98,11 @@ def generate_all_patterns(grid_size, shapes):
                                 all_grids.append(g3)
     return all_grids
 
-def prune_duplicates(all_grids, visualize=False):
+def prune_duplicates(all_grids, visualize=False, relabel=False):
     """
     Keep one of each normalized layout; print & visualize all duplicate occurrences,
-    but subtract each duplicate layout only once from the total.
+    but subtract each duplicate layout only once from the total.  With relabel,
+    layouts that differ only by colour interchange count as duplicates too.
     """
     seen_counts = {}    # norm -> total occurrences
     deleted_keys = set()
@@ -101,7 +110,7 @@ def prune_duplicates(all_grids, visualize=False):
     deletions = 0
 
     for idx, g in enumerate(all_grids, 1):
-        key = normalize_pattern(g)
+        key = normalize_pattern(g, relabel)
         seen_counts[key] = seen_counts.get(key, 0) + 1
 
         if seen_counts[key] == 1:
@@ -148,6 +157,11 @@ def main():
     print(f"\nDeleted {deletions} duplicate keys  →  Final unique: {final_total}")
     print(f"Check: {raw_total} − {deletions} = {final_total}")
 
+    # Up to colour interchange, relabelled in one pass over the whole stack
+    stack = relabel_colors(encode_grid(np.array(unique_patterns)))
+    up_to_colors = len(np.unique(stack.reshape(len(stack), -1), axis=0))
+    print(f"Unique up to colour interchange: {up_to_colors}")
+
     # If you'd like, set visualize=True to see each duplicate grid as it's pruned.
 
 if __name__ == "__main__":
@@ -1,55 +1,19 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from itertools import permutations
-
-# Create and manage a 2D grid
-def create_empty_grid(rows, cols):
-    return np.full((rows, cols), 'E')
-
-def can_place(grid, row, col, shape):
-    """Check if a shape fits within the grid boundaries."""
-    return row + shape[0] <= grid.shape[0] and col + shape[1] <= grid.shape[1]
-
-def place_shape(grid, row, col, shape, color):
-    """Return a new grid with the shape placed at (row, col)."""
-    grid_copy = grid.copy()
-    grid_copy[row:row + shape[0], col:col + shape[1]] = color
-    return grid_copy
-
-# Ensure each shape remains at least partly visible
-def is_shape_visible(grid, color):
-    return np.any(grid == color)
+from itertools import chain
+from bitgrid import color_alphabet
+from engine import iter_chunks, iter_patterns
+from gallery import write_gallery
+from patternstore import write_store
 
 # Generate all patterns (no duplicate filtering)
-def generate_patterns(grid_size, shapes):
-    """Generate all patterns without duplicate filtering."""
-    rows, cols = grid_size
-    all_patterns = []
-
-    # Try all permutations of shape placement order
-    for shape_order in permutations(shapes, len(shapes)):
-        grids_to_process = [create_empty_grid(rows, cols)]
-
-        # Place each shape in the current order
-        for (shape, color) in shape_order:
-            new_grids = []
-            orientations = [(shape[0], shape[1])]
-            if shape[0] != shape[1]:
-                orientations.append((shape[1], shape[0]))
+def generate_patterns(grid_size, shapes, require_visible=False):
+    """Generate all patterns without duplicate filtering.
 
-            for grid in grids_to_process:
-                for oriented in orientations:
-                    for r in range(rows):
-                        for c in range(cols):
-                            if can_place(grid, r, c, oriented):
-                                placed = place_shape(grid, r, c, oriented, color)
-                                if is_shape_visible(placed, color):
-                                    new_grids.append(placed)
-            grids_to_process = new_grids
-
-        all_patterns.extend(grids_to_process)
-
-    return all_patterns
+    The original visibility check only looked at the shape just placed, which
+    is always on top, so it kept every layout; ``require_visible=True`` keeps
+    only the layouts in which every shape still shows a cell.
+    """
+    return list(iter_patterns(grid_size, shapes, require_visible,
+                              share_prefixes=False))
 
 # Validate that shapes fit the grid
 def validate_shapes(grid_size, shapes):
@@ -61,6 +25,8 @@ def validate_shapes(grid_size, shapes):
 
 # Save patterns to a text file
 def save_patterns_to_file(patterns, filename="patterns.txt"):
+    """Write patterns from any iterable (e.g. a stream) and return the count."""
+    count = 0
     with open(filename, 'w') as f:
         for idx, grid in enumerate(patterns, start=1):
             f.write(f"Pattern {idx}:\n")
@@ -69,21 +35,9 @@ def save_patterns_to_file(patterns, filename="patterns.txt"):
                 row_str = ' '.join(f"'{c}'" for c in row)
                 f.write(f"[{row_str}]\n")
             f.write("\n")
-    print(f"Saved {len(patterns)} patterns to '{filename}'")
-
-# Simple visualization of a few patterns
-def visualize_grid(grid, idx):
-    rgb = np.ones((*grid.shape, 3))
-    mapping = {'R': [1,0,0], 'G': [0,1,0], 'B': [0,0,1], 'E': [1,1,1]}
-    for i in range(grid.shape[0]):
-        for j in range(grid.shape[1]):
-            rgb[i,j] = mapping[grid[i,j]]
-    plt.figure(figsize=(6,3))
-    plt.imshow(rgb)
-    plt.xticks([])
-    plt.yticks([])
-    plt.title(f"Pattern {idx+1}")
-    plt.show()
+            count = idx
+    print(f"Saved {count} patterns to '{filename}'")
+    return count
 
 # Entry point
 def main():
@@ -93,15 +47,20 @@ def main():
     if not validate_shapes(grid_size, shapes):
         return
 
-    patterns = generate_patterns(grid_size, shapes)
-    print(f"\nTotal patterns (duplicates included): {len(patterns)}\n")
-
-    # Save to file
-    save_patterns_to_file(patterns, "patterns1.txt")
-
-    # Optionally visualize first few
-    for idx, pat in enumerate(patterns[:20]):
-        visualize_grid(pat, idx)
+    # Stream straight into a binary pattern store; nothing is held in memory.
+    # save_patterns_to_file still writes the old text format if needed.  The
+    # first chunk is peeked for the gallery, so the patterns are built once.
+    colors = color_alphabet(shapes)
+    chunks = iter_chunks(grid_size, shapes, share_prefixes=False)
+    head = next(chunks)
+    count = write_store("patterns1.pat", chain([head], chunks), grid_size, colors)
+    print(f"Saved {count} patterns to 'patterns1.pat'")
+    print(f"\nTotal patterns (duplicates included): {count}\n")
+
+    # Optionally visualize the first few, as one PNG contact sheet
+    pages = write_gallery([head[:20]], colors, prefix="patterns1_gallery", per_page=20,
+                          columns=4)
+    print(f"Gallery written to {', '.join(pages)}")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,136 @@
+import numpy as np
+from engine import iter_chunks
+from fingerprint import dedupe_stack, fingerprint_stack, remember
+
+# ---------- grid symmetries --------------------------------------------------
+# A layout and its mirror images are treated as one design.  Every grid has
+# the four symmetries of a rectangle (identity, both flips, half turn); a
+# square grid also has the quarter turns and the two diagonal reflections.
+# The set of layouts is closed under all of them, because each shape's
+# placements (both orientations) are, so orbits partition it cleanly.
+RECTANGLE = ('identity', 'flip_lr', 'flip_ud', 'rot180')
+SQUARE = RECTANGLE + ('rot90', 'rot270', 'transpose', 'antitranspose')
+
+
+def symmetries(grid_size):
+    """Names of the symmetries of a rows x cols grid."""
+    return SQUARE if grid_size[0] == grid_size[1] else RECTANGLE
+
+
+def transform_stack(stack, name):
+    """Apply one symmetry to every grid of an (N, rows, cols) stack at once."""
+    stack = np.asarray(stack)
+    if name == 'identity':
+        return stack
+    if name == 'flip_lr':
+        return stack[:, :, ::-1]
+    if name == 'flip_ud':
+        return stack[:, ::-1, :]
+    if name == 'rot180':
+        return stack[:, ::-1, ::-1]
+    if name == 'rot90':
+        return np.rot90(stack, 1, axes=(1, 2))
+    if name == 'rot270':
+        return np.rot90(stack, -1, axes=(1, 2))
+    if name == 'transpose':
+        return stack.transpose(0, 2, 1)
+    if name == 'antitranspose':
+        return stack[:, ::-1, ::-1].transpose(0, 2, 1)
+    raise ValueError(f"Unknown symmetry {name!r}.")
+
+# ---------- canonical representatives ----------------------------------------
+def canonical_stack(stack, names=None):
+    """Orbit representative of every grid: its lexicographically smallest image.
+
+    Returns ``(canonical, which)`` where ``which[i]`` indexes ``names`` (default:
+    every symmetry of the grid) for the image chosen for grid i.  The images
+    of the whole stack are compared cell by cell, vectorized across grids, so
+    the cost is one pass over the cells per symmetry.
+    """
+    stack = np.asarray(stack, dtype=np.uint8)
+    if names is None:
+        names = symmetries(stack.shape[1:])
+    images = np.stack([np.ascontiguousarray(transform_stack(stack, n)).reshape(len(stack), -1)
+                       for n in names])                     # (G, N, cells)
+    alive = np.ones(images.shape[:2], dtype=bool)
+    for c in range(images.shape[2]):
+        column = np.where(alive, images[:, :, c], 255)
+        alive &= column == column.min(axis=0)
+    which = alive.argmax(axis=0)
+    canonical = images[which, np.arange(len(stack))].reshape(stack.shape)
+    return canonical, which
+
+
+def fixed_counts(stack, names=None):
+    """How many grids of the stack each symmetry leaves unchanged."""
+    stack = np.asarray(stack, dtype=np.uint8)
+    if names is None:
+        names = symmetries(stack.shape[1:])
+    return {n: int((transform_stack(stack, n) == stack).all(axis=(1, 2)).sum())
+            for n in names}
+
+# ---------- symmetry-reduced enumeration -------------------------------------
+def iter_orbit_chunks(grid_size, shapes, require_visible=False, **kwargs):
+    """Yield one canonical representative per orbit, as uint8 code stacks.
+
+    Each raw chunk is canonicalized in one vectorized call and folded into a
+    fingerprint index of representatives; only first sightings are yielded.
+    """
+    seen = {}
+    start = 0
+    for chunk in iter_chunks(grid_size, shapes, require_visible=require_visible, **kwargs):
+        canonical, _ = canonical_stack(chunk)
+        dups = {i - start for i, _ in dedupe_stack(canonical, seen, start)}
+        keep = [i for i in range(len(chunk)) if i not in dups]
+        start += len(chunk)
+        if keep:
+            yield canonical[keep]
+
+
+def symmetry_counts(grid_size, shapes, require_visible=False, **kwargs):
+    """Raw, distinct and orbit counts of an enumeration, with a Burnside check.
+
+    Returns a dict with ``total`` layouts generated, ``unique`` distinct
+    layouts, ``orbits`` distinct layouts up to symmetry (from canonical
+    representatives), ``fixed`` (symmetry -> distinct layouts it fixes) and
+    ``burnside``, the orbit count from Burnside's lemma: the mean of ``fixed``
+    over the symmetry group.  ``orbits`` and ``burnside`` always agree.
+    """
+    names = symmetries(grid_size)
+    seen = {}
+    orbit_seen = {}
+    fixed = dict.fromkeys(names, 0)
+    total = 0
+    unique = 0
+    orbits = 0
+    for chunk in iter_chunks(grid_size, shapes, require_visible=require_visible, **kwargs):
+        fresh = [i for i, (grid, fp) in enumerate(zip(chunk, fingerprint_stack(chunk)))
+                 if remember(seen, int(fp), grid, total + i) is None]
+        total += len(chunk)
+        if not fresh:
+            continue
+        distinct = chunk[fresh]
+        for name, n in fixed_counts(distinct, names).items():
+            fixed[name] += n
+        canonical, _ = canonical_stack(distinct, names)
+        orbits += len(distinct) - len(dedupe_stack(canonical, orbit_seen, unique))
+        unique += len(distinct)
+    return {'total': total, 'unique': unique, 'orbits': orbits, 'fixed': fixed,
+            'burnside': sum(fixed.values()) // len(names)}
+
+# ---------- driver -----------------------------------------------------------
+def main():
+    shapes = [((3, 3), 'R'),   # red square
+              ((2, 5), 'G'),   # green rectangle
+              ((1, 9), 'B')]   # blue rectangle
+
+    for grid_size in [(3, 9), (4, 10), (9, 9)]:
+        for require_visible in (False, True):
+            counts = symmetry_counts(grid_size, shapes, require_visible)
+            print(f"{grid_size} visible={require_visible}: {counts['total']} generated, "
+                  f"{counts['unique']} unique, {counts['orbits']} up to symmetry "
+                  f"(Burnside {counts['burnside']})")
+            print("  fixed: " + ", ".join(f"{n} {k}" for n, k in counts['fixed'].items()))
+
+if __name__ == "__main__":
+    main()
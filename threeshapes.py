@@ -1,55 +1,16 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from itertools import permutations
-
-# Create and manage a 2D grid
-def create_empty_grid(rows, cols):
-    return np.full((rows, cols), 'E')
-
-def can_place(grid, row, col, shape):
-    """Check if a shape fits within the grid boundaries."""
-    return row + shape[0] <= grid.shape[0] and col + shape[1] <= grid.shape[1]
-
-def place_shape(grid, row, col, shape, color):
-    """Return a new grid with the shape placed at (row, col)."""
-    grid_copy = grid.copy()
-    grid_copy[row:row + shape[0], col:col + shape[1]] = color
-    return grid_copy
-
-# Ensure each shape remains at least partly visible
-def is_shape_visible(grid, color):
-    return np.any(grid == color)
+from bitgrid import color_alphabet
+from engine import iter_chunks, iter_patterns
+from gallery import write_gallery
 
 # Generate all patterns (no duplicate filtering)
-def generate_patterns(grid_size, shapes):
-    """Generate all patterns without duplicate filtering."""
-    rows, cols = grid_size
-    all_patterns = []
-
-    # Try all permutations of shape placement order
-    for shape_order in permutations(shapes, len(shapes)):
-        grids_to_process = [create_empty_grid(rows, cols)]
+def generate_patterns(grid_size, shapes, require_visible=False):
+    """Generate all patterns without duplicate filtering.
 
-        # Place each shape in the current order
-        for (shape, color) in shape_order:
-            new_grids = []
-            orientations = [(shape[0], shape[1])]
-            if shape[0] != shape[1]:
-                orientations.append((shape[1], shape[0]))
-
-            for grid in grids_to_process:
-                for oriented in orientations:
-                    for r in range(rows):
-                        for c in range(cols):
-                            if can_place(grid, r, c, oriented):
-                                placed = place_shape(grid, r, c, oriented, color)
-                                if is_shape_visible(placed, color):
-                                    new_grids.append(placed)
-            grids_to_process = new_grids
-
-        all_patterns.extend(grids_to_process)
-
-    return all_patterns
+    With ``require_visible`` only layouts where no shape is fully covered
+    are kept.
+    """
+    return list(iter_patterns(grid_size, shapes, require_visible,
+                              share_prefixes=False))
 
 # Validate that shapes fit the grid
 def validate_shapes(grid_size, shapes):
@@ -59,20 +20,6 @@ def validate_shapes(grid_size, shapes):
             return False
     return True
 
-# Simple visualization of a few patterns
-def visualize_grid(grid, idx):
-    rgb = np.ones((*grid.shape, 3))
-    mapping = {'R': [1,0,0], 'G': [0,1,0], 'B': [0,0,1], 'E': [1,1,1]}
-    for i in range(grid.shape[0]):
-        for j in range(grid.shape[1]):
-            rgb[i,j] = mapping[grid[i,j]]
-    plt.figure(figsize=(6,3))
-    plt.imshow(rgb)
-    plt.xticks([])
-    plt.yticks([])
-    plt.title(f"Pattern {idx+1}")
-    plt.show()
-
 # Entry point
 def main():
     grid_size = (3, 9)
@@ -81,13 +28,19 @@ def main():
     if not validate_shapes(grid_size, shapes):
         return
 
-    patterns = generate_patterns(grid_size, shapes)
-    print(f"\nTotal patterns (duplicates included): {len(patterns)}\n")
-
-    # Show first few patterns
-    for idx, pat in enumerate(patterns[:2000]):
-        print(f"Pattern {idx+1}:\n{pat}\n")
-        visualize_grid(pat, idx)
+    # One pass: count every pattern and keep the first 2000 for the gallery,
+    # tiled into PNG contact sheets (500 per page) instead of one window each
+    total = 0
+    first = []
+    for chunk in iter_chunks(grid_size, shapes, chunk_size=500, share_prefixes=False):
+        if total < 2000:
+            first.append(chunk[:2000 - total])
+        total += len(chunk)
+    print(f"\nTotal patterns (duplicates included): {total}\n")
+
+    pages = write_gallery(first, color_alphabet(shapes),
+                          prefix="threeshapes_gallery", per_page=500)
+    print(f"Gallery written to {', '.join(pages)}")
 
 if __name__ == '__main__':
     main()
@@ -1,66 +1,41 @@
-import numpy as np
-import matplotlib.pyplot as plt
-from itertools import permutations
-import pandas as pd
-
-def create_empty_grid(rows, cols):
-    return np.full((rows, cols), 'E')
-
-def can_place(grid, row, col, shape):
-    return row + shape[0] <= grid.shape[0] and col + shape[1] <= grid.shape[1]
-
-def place_shape(grid, row, col, shape, color):
-    grid_copy = grid.copy()
-    grid_copy[row:row + shape[0], col:col + shape[1]] = color
-    return grid_copy
-
-def shape_orientations(shape):
-    return [shape, (shape[1], shape[0])] if shape[0] != shape[1] else [shape]
-
-def grids_are_equal(g1, g2):
-    return np.array_equal(g1, g2)
+from bitgrid import color_alphabet, decode_grid
+from engine import iter_chunks
+from fingerprint import fingerprint_stack, remember
+from duplicatepairs import write_pairs
+
+def duplicate_pairs(grid_size, shapes, patterns=None, counts=None):
+    """Yield (duplicate index, original index) pairs as they are found.
+
+    Unique patterns are appended to ``patterns`` when a list is given; a
+    ``counts`` dict gets the running 'total' and 'unique' counts instead, so
+    nothing but the dedupe index is held in memory.
+    """
+    seen = {}  # fingerprint -> [(cells, index of the unique pattern)]
+    colors = color_alphabet(shapes)
+    n_unique = 0
+    if counts is not None:
+        counts.update(total=0, unique=0)
+
+    # every stacking order, order by order, so indices keep their numbering;
+    # each new grid is looked up by fingerprint instead of scanning every kept
+    # pattern, and only a fingerprint hit is compared cell by cell
+    for chunk in iter_chunks(grid_size, shapes, share_prefixes=False):
+        if counts is not None:
+            counts['total'] += len(chunk)
+        for grid, h in zip(chunk, fingerprint_stack(chunk)):
+            original = remember(seen, int(h), grid, n_unique)
+            if original is not None:
+                yield n_unique, original
+            else:
+                n_unique += 1
+                if counts is not None:
+                    counts['unique'] = n_unique
+                if patterns is not None:
+                    patterns.append(decode_grid(grid, colors))
 
 def generate_patterns(grid_size, shapes):
-    rows, cols = grid_size
     patterns = []
-    duplicate_patterns = []
-
-    permutations_to_process = [
-        [0, 1, 2],
-        [0, 2, 1],
-        [1, 0, 2],
-        [1, 2, 0],
-        [2, 0, 1],
-        [2, 1, 0],
-    ]
-
-    for order in permutations_to_process:
-        grids_to_process = [create_empty_grid(rows, cols)]
-
-        for idx in order:
-            shape, color = shapes[idx]
-            new_grids = []
-            orientations = shape_orientations(shape)
-
-            for grid in grids_to_process:
-                for oriented_shape in orientations:
-                    for r in range(rows):
-                        for c in range(cols):
-                            if can_place(grid, r, c, oriented_shape):
-                                placed_grid = place_shape(grid, r, c, oriented_shape, color)
-                                new_grids.append(placed_grid)
-            grids_to_process = new_grids
-
-        for grid in grids_to_process:
-            is_duplicate = False
-            for i, existing in enumerate(patterns):
-                if grids_are_equal(grid, existing):
-                    duplicate_patterns.append((len(patterns), i))
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                patterns.append(grid)
-
+    duplicate_patterns = list(duplicate_pairs(grid_size, shapes, patterns))
     return patterns, duplicate_patterns
 
 def main():
@@ -70,16 +45,15 @@ def main():
     shape3 = (1, 9)  # Blue Rectangle
     shapes = [(shape1, 'R'), (shape2, 'G'), (shape3, 'B')]
 
-    patterns, duplicate_patterns = generate_patterns(grid_size, shapes)
-
-    print(f"Total patterns generated: {len(patterns) + len(duplicate_patterns)}")
-    print(f"Total unique patterns: {len(patterns)}")
-    print(f"Total duplicate patterns: {len(duplicate_patterns)}")
+    # Stream duplicates to CSV (and a binary pairs file) as they are found
+    counts = {}
+    n_duplicates = write_pairs(duplicate_pairs(grid_size, shapes, counts=counts),
+                               "duplicate_patterns.csv", "duplicate_patterns.pairs")
 
-    # Save duplicates to CSV
-    df = pd.DataFrame(duplicate_patterns, columns=["Duplicate Index", "Original Index"])
-    df.to_csv("duplicate_patterns.csv", index=False)
-    print("Duplicate info saved to 'duplicate_patterns.csv'")
+    print(f"Total patterns generated: {counts['total']}")
+    print(f"Total unique patterns: {counts['unique']}")
+    print(f"Total duplicate patterns: {n_duplicates}")
+    print("Duplicate info saved to 'duplicate_patterns.csv' and 'duplicate_patterns.pairs'")
 
 if __name__ == "__main__":
     main()